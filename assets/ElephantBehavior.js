@@ -0,0 +1,49 @@
+
+// src/animals/Elephant/ElephantBehavior.js
+import * as THREE from 'three';
+import { ElephantLocomotion } from './ElephantLocomotion.js';
+import { hasVertices, setSkinnedMeshBounds } from './ElephantGeometry.js';
+
+export class ElephantBehavior {
+  constructor(skeleton, mesh, opts = {}) {
+    this.skeleton = skeleton;
+    this.mesh = mesh;
+    this.time = 0;
+    this.state = 'idle';
+    this.bones = {};
+    this.skeleton.bones.forEach((bone) => {
+      this.bones[bone.name] = bone;
+    });
+    // updateMatrixWorld(true) already recurses into children, so refreshing
+    // the root bones alone updates each bone exactly once.
+    const skeletonBones = new Set(this.skeleton.bones);
+    this._rootBones = this.skeleton.bones.filter((bone) => !skeletonBones.has(bone.parent));
+    this.locomotion = new ElephantLocomotion(this);
+    this._boundsFitted = false;
+    this.debug = { enabled: !!opts.debug };
+  }
+  setState(nextState) { this.state = nextState; }
+  update(dt) {
+    if (!dt || !this.skeleton || !this.mesh) return;
+    this.time += dt;
+    if (this.locomotion && typeof this.locomotion.update === 'function') {
+      this.locomotion.update(dt);
+    }
+    // Hidden elephants keep animating but leave their matrices until shown.
+    if (!this.mesh.visible) return;
+    for (const bone of this._rootBones) bone.updateMatrixWorld(true);
+    // Bounds are fitted to the first walking pose, not the bind pose, since
+    // locomotion moves the root away from where the definition puts it.
+    if (!this._boundsFitted && hasVertices(this.mesh.geometry)) {
+      setSkinnedMeshBounds(this.mesh);
+      this._boundsFitted = true;
+    }
+  }
+  getDebugInfo() {
+    return {
+      state: this.state,
+      time: this.time,
+      locomotionState: this.locomotion ? this.locomotion.state : null
+    };
+  }
+}
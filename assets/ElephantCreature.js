@@ -0,0 +1,98 @@
+
+// src/animals/ElephantCreature.js
+
+import * as THREE from 'three';
+import { ElephantDefinition } from './ElephantDefinition.js';
+import { ElephantGenerator } from './ElephantGenerator.js';
+import { buildBonesFromDefinition, buildElephantGeometry } from './ElephantGeometry.js';
+
+export class ElephantCreature extends THREE.Group {
+  constructor(options = {}) {
+    super();
+    this.bones = this._buildBonesFromDefinition(ElephantDefinition.bones);
+    this.skeleton = new THREE.Skeleton(this.bones);
+    const rootBone = this.bones.find(b => b.name === 'spine_base') || this.bones[0];
+    this.add(rootBone);
+    this.updateMatrixWorld(true);
+    
+    // Building the body takes a noticeable slice of a frame, so where workers
+    // exist the mesh starts with an empty geometry and the worker's result is
+    // swapped in when it arrives. Pass geometryWorker: false to build inline.
+    // The placeholder still needs a (zero-length) position attribute: the
+    // SkinnedMesh bounds that culling and BoxHelper compute read its count.
+    const useWorker = options.geometryWorker !== false && typeof Worker !== 'undefined';
+    const placeholder = useWorker ? new THREE.BufferGeometry() : undefined;
+    if (placeholder) placeholder.setAttribute('position', new THREE.Float32BufferAttribute([], 3));
+    const { mesh, behavior } = ElephantGenerator.generate(this.skeleton, {
+      ...options,
+      geometry: placeholder
+    });
+    this.mesh = mesh;
+    this.behavior = behavior; 
+    if (useWorker) this._buildGeometryInWorker(options);
+
+    this.add(mesh);
+
+    if (options.debug) {
+        this.skeletonHelper = new THREE.SkeletonHelper(this.mesh);
+        this.skeletonHelper.material.linewidth = 2;
+        this.skeletonHelper.material.color.set(0xffff00); 
+        this.add(this.skeletonHelper);
+    }
+    if (options.position) this.position.fromArray(options.position);
+    if (options.scale) this.scale.setScalar(options.scale);
+  }
+
+  _buildBonesFromDefinition(boneDefs) {
+    return buildBonesFromDefinition(boneDefs);
+  }
+
+  _buildGeometryInWorker(options) {
+    const worker = new Worker(new URL('../../workers/geometryWorker.js', import.meta.url), { type: 'module' });
+    const fallback = (reason) => {
+      console.warn('Elephant geometry worker failed, building on the main thread:', reason);
+      // Build from a fresh bind-pose skeleton, as the worker does; this one
+      // may already be animating.
+      const bindPose = new THREE.Skeleton(buildBonesFromDefinition(ElephantDefinition.bones));
+      this._setGeometry(buildElephantGeometry(bindPose, options));
+    };
+
+    worker.onmessage = ({ data }) => {
+      worker.terminate();
+      if (data.error) {
+        fallback(data.error);
+        return;
+      }
+      const geometry = new THREE.BufferGeometry();
+      for (const [name, { array, itemSize, normalized }] of Object.entries(data.attributes)) {
+        geometry.setAttribute(name, new THREE.BufferAttribute(array, itemSize, normalized));
+      }
+      this._setGeometry(geometry);
+    };
+    worker.onerror = (event) => {
+      worker.terminate();
+      event.preventDefault();
+      fallback(event.message);
+    };
+
+    worker.postMessage({
+      skeletonDefinition: ElephantDefinition.bones,
+      options: { variantSeed: options.variantSeed }
+    });
+  }
+
+  _setGeometry(geometry) {
+    this.mesh.geometry.dispose();
+    this.mesh.geometry = geometry;
+    // SkinnedMesh caches its bounds; drop any taken from the placeholder.
+    // ElephantBehavior fits padded ones on its next update, as it skips the
+    // placeholder.
+    this.mesh.boundingBox = null;
+    this.mesh.boundingSphere = null;
+  }
+
+  update(delta) {
+    if (this.behavior) this.behavior.update(delta);
+    if (this.skeletonHelper) this.skeletonHelper.update();
+  }
+}
@@ -0,0 +1,43 @@
+
+// src/animals/ElephantDefinition.js
+
+export const ElephantDefinition = {
+  bones: [
+    { name: 'spine_base',  parent: 'root',       position: [0, 2.1, 0] }, 
+    { name: 'spine_mid',   parent: 'spine_base', position: [0, -0.1, 1.1] },
+    { name: 'spine_neck',  parent: 'spine_mid',  position: [0, 0.3, 0.9] },
+    { name: 'head',        parent: 'spine_neck', position: [0, -0.1, 0.7] },
+    { name: 'trunk_base',  parent: 'head',        position: [0, -0.3, 0.6] },
+    { name: 'trunk_mid1',  parent: 'trunk_base',  position: [0, -0.5, 0.1] },
+    { name: 'trunk_mid2',  parent: 'trunk_mid1',  position: [0, -0.5, 0.0] },
+    { name: 'trunk_tip',   parent: 'trunk_mid2',  position: [0, -0.4, 0.0] },
+    { name: 'tusk_left',   parent: 'head',        position: [ 0.3, -0.3, 0.4] },
+    { name: 'tusk_left_tip', parent: 'tusk_left', position: [ 0.1, 0.3, 0.5] }, 
+    { name: 'tusk_right',  parent: 'head',        position: [-0.3, -0.3, 0.4] },
+    { name: 'tusk_right_tip', parent: 'tusk_right', position: [-0.1, 0.3, 0.5] },
+    { name: 'ear_left',    parent: 'head',        position: [ 0.4, 0.1, -0.2] },
+    { name: 'ear_left_tip', parent: 'ear_left',   position: [ 0.6, -0.6, -0.1] }, 
+    { name: 'ear_right',   parent: 'head',        position: [-0.4, 0.1, -0.2] },
+    { name: 'ear_right_tip', parent: 'ear_right', position: [-0.6, -0.6, -0.1] },
+    { name: 'tail_base',   parent: 'spine_base', position: [0, 0.3, -0.3] },
+    { name: 'tail_mid',    parent: 'tail_base',  position: [0, -0.6, -0.2] }, 
+    { name: 'tail_tip',    parent: 'tail_mid',   position: [0, -0.6, 0.0] },
+    { name: 'front_left_collarbone',  parent: 'spine_mid', position: [ 0.4, -0.3, 0.3] },
+    { name: 'front_right_collarbone', parent: 'spine_mid', position: [-0.4, -0.3, 0.3] },
+    { name: 'back_left_pelvis',  parent: 'spine_base', position: [ 0.45, -0.2, 0.1] },
+    { name: 'back_right_pelvis', parent: 'spine_base', position: [-0.45, -0.2, 0.1] },
+    { name: 'front_left_upper',  parent: 'front_left_collarbone', position: [0, -0.8, 0] },
+    { name: 'front_left_lower',  parent: 'front_left_upper',      position: [0, -0.8, 0.05] },
+    { name: 'front_left_foot',   parent: 'front_left_lower',      position: [0, -0.4, 0.05] },
+    { name: 'front_right_upper', parent: 'front_right_collarbone', position: [0, -0.8, 0] },
+    { name: 'front_right_lower', parent: 'front_right_upper',      position: [0, -0.8, 0.05] },
+    { name: 'front_right_foot',  parent: 'front_right_lower',      position: [0, -0.4, 0.05] },
+    { name: 'back_left_upper',   parent: 'back_left_pelvis',  position: [0, -0.8, 0.05] },
+    { name: 'back_left_lower',   parent: 'back_left_upper',   position: [0, -0.8, -0.1] },
+    { name: 'back_left_foot',    parent: 'back_left_lower',   position: [0, -0.4, 0.1] },
+    { name: 'back_right_upper',  parent: 'back_right_pelvis',  position: [0, -0.8, 0.05] },
+    { name: 'back_right_lower',  parent: 'back_right_upper',   position: [0, -0.8, -0.1] },
+    { name: 'back_right_foot',   parent: 'back_right_lower',   position: [0, -0.4, 0.1] }
+  ],
+  sizes: {}
+};
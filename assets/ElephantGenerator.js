@@ -0,0 +1,31 @@
+// src/animals/ElephantGenerator.js
+
+import * as THREE from 'three';
+import { buildElephantGeometry } from './ElephantGeometry.js';
+import { ElephantBehavior } from './ElephantBehavior.js';
+
+import { createElephantSkinMaterial } from './ElephantSkinNode.js';
+
+export class ElephantGenerator {
+  /**
+   * options.geometry may carry an already built body (e.g. a placeholder
+   * that a geometry worker fills in later); otherwise it is built here.
+   */
+  static generate(skeleton, options = {}) {
+    const mergedGeometry = options.geometry || buildElephantGeometry(skeleton, options);
+
+    // === Material (Node-based elephant skin) ===
+    const material = createElephantSkinMaterial({
+      bodyColor: options.bodyColor
+    });
+
+    const mesh = new THREE.SkinnedMesh(mergedGeometry, material);
+    mesh.castShadow = true;
+    mesh.receiveShadow = true;
+    mesh.bind(skeleton);
+
+    const behavior = new ElephantBehavior(skeleton, mesh);
+
+    return { mesh, behavior };
+  }
+}
@@ -0,0 +1,273 @@
+
+// src/animals/Elephant/ElephantGeometry.js
+
+import * as THREE from 'three';
+import { generateTorsoGeometry } from '../bodyParts/TorsoGenerator.js';
+import { generateNeckGeometry } from '../bodyParts/NeckGenerator.js';
+import { generateHeadGeometry } from '../bodyParts/HeadGenerator.js';
+import { generateTailGeometry } from '../bodyParts/TailGenerator.js';
+import { generateLimbGeometry } from '../bodyParts/LimbGenerator.js';
+import {
+  buildFlatFromIndexed,
+  expandAttribute,
+  getBoneIndexMap,
+  initFlatNormals,
+  mergeFlatParts,
+  mirrorGeometryX
+} from '../../utils/GeometryBuilder.js';
+
+/**
+ * Utility: Expands geometry into a triangle soup with per-face normals for a
+ * hard-edged "Low Poly / Flat Shaded" look. Positions and flat normals are
+ * produced together in one pass instead of expand / delete / recompute.
+ */
+function makeFlat(geometry) {
+  const index = geometry.index ? geometry.index.array : null;
+  const { positions, normals } = buildFlatFromIndexed(geometry.attributes.position.array, index);
+
+  // Already a soup: only the normals change, every other attribute is reused.
+  let flatGeo = geometry;
+  if (index) {
+    flatGeo = new THREE.BufferGeometry();
+    for (const name of Object.keys(geometry.attributes)) {
+      if (name === 'position' || name === 'normal') continue;
+      flatGeo.setAttribute(name, expandAttribute(geometry.attributes[name], index));
+    }
+  }
+  flatGeo.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+  flatGeo.setAttribute('normal', new THREE.BufferAttribute(normals, 3));
+
+  return flatGeo;
+}
+
+// Start loading the SIMD flat-normal kernel; makeFlat picks it up once ready.
+initFlatNormals();
+
+const MIRROR_EPSILON = 1e-4;
+const _leftPos = new THREE.Vector3();
+const _rightPos = new THREE.Vector3();
+
+/**
+ * Utility: Builds the right-hand twin of a left-side part by reflecting it
+ * across x = 0 instead of running its generator again. The part's bones
+ * ('*left*' names plus any unsided bones it hangs off) must mirror the
+ * skeleton's right side; otherwise null is returned and the caller
+ * generates the right part itself.
+ */
+function mirrorPart(leftGeometry, skeleton, boneNames) {
+  const boneIndexMap = getBoneIndexMap(skeleton);
+  const boneIndex = (name) => (name in boneIndexMap ? boneIndexMap[name] : -1);
+  const boneRemap = new Map();
+
+  for (const leftName of boneNames) {
+    const rightName = leftName.replace('left', 'right');
+    const left = boneIndex(leftName);
+    const right = boneIndex(rightName);
+    if (left < 0 || right < 0) return null;
+
+    _leftPos.setFromMatrixPosition(skeleton.bones[left].matrixWorld);
+    _rightPos.setFromMatrixPosition(skeleton.bones[right].matrixWorld);
+    if (Math.abs(_leftPos.x + _rightPos.x) > MIRROR_EPSILON ||
+        Math.abs(_leftPos.y - _rightPos.y) > MIRROR_EPSILON ||
+        Math.abs(_leftPos.z - _rightPos.z) > MIRROR_EPSILON) {
+      return null;
+    }
+    if (left !== right) boneRemap.set(left, right);
+  }
+
+  return mirrorGeometryX(leftGeometry, boneRemap);
+}
+
+// Part options shared by the left/right pairs; only the bone names differ.
+const TUSK_OPTS = { sides: 5, baseRadius: 0.12, tipRadius: 0.02 }; // Pentagonal
+const EAR_OPTS = { radii: [0.65, 0.35], sides: 4 }; // Square/Diamond cross section
+const LEG_OPTS = { sides: 6 }; // Hexagonal pillars
+const LEG_RADII_FRONT = [0.5, 0.45, 0.4, 0.38, 0.43];
+const LEG_RADII_BACK = [0.55, 0.5, 0.42, 0.38, 0.44];
+
+/**
+ * Creates the bone hierarchy described by ElephantDefinition.bones and
+ * returns the bones in definition order.
+ */
+export function buildBonesFromDefinition(boneDefs) {
+  const boneMap = {};
+  for (const def of boneDefs) {
+    const bone = new THREE.Bone();
+    bone.name = def.name;
+    bone.position.fromArray(def.position);
+    boneMap[def.name] = bone;
+  }
+  for (const def of boneDefs) {
+    if (def.parent && boneMap[def.parent] && def.parent !== 'root') {
+      boneMap[def.parent].add(boneMap[def.name]);
+    }
+  }
+  return boneDefs.map(def => boneMap[def.name]);
+}
+
+/**
+ * Builds the merged, flat-shaded elephant body for a skeleton. Only plain
+ * geometry is touched here (no materials, textures or DOM), so this also runs
+ * inside src/workers/geometryWorker.js.
+ */
+export function buildElephantGeometry(skeleton, options = {}) {
+  // Make sure all bone world matrices are current before sampling. One
+  // recursive update per root bone covers the whole hierarchy once; the
+  // generators below only read matrixWorld.
+  const skeletonBones = new Set(skeleton.bones);
+  for (const bone of skeleton.bones) {
+    if (!skeletonBones.has(bone.parent)) bone.updateMatrixWorld(true);
+  }
+
+  const seed = typeof options.variantSeed === 'number' ? options.variantSeed : 0.5;
+  const random01 = (s) => Math.abs(Math.sin(s * 43758.5453)) % 1;
+  const variantFactor = random01(seed);
+
+  const legScale    = 1.0 + (variantFactor - 0.5) * 0.2;
+  const tuskScale   = 1.0 + (variantFactor - 0.5) * 0.3;
+  const headScale   = 1.0 + (0.5 - variantFactor) * 0.15;
+
+  // === 1. TORSO (Decagonal Prism) ===
+  // Reduced sides from 28 to 10 for blocky look
+  const torsoGeometry = makeFlat(generateTorsoGeometry(skeleton, {
+    bones: ['spine_base', 'spine_mid', 'spine_neck', 'head'],
+    radii: [1.15 * headScale, 1.35, 1.15, 0.9 * headScale],
+    sides: 10 
+  }));
+
+  // === 2. HEAD (Low Poly Icosahedron) ===
+  // Reduced detail significantly
+  const headGeometry = makeFlat(generateHeadGeometry(skeleton, {
+    parentBone: 'head',
+    radius: 0.95 * headScale,
+    detail: 0, // 0 subdivisions = 20 faces total (Icosahedron)
+    sides: 1   // (Passed but mostly ignored by Icosahedron logic, kept for safety)
+  }));
+
+  // === 3. TRUNK (Hexagonal Tube) ===
+  const trunkGeometry = makeFlat(generateTailGeometry(skeleton, {
+    bones: ['trunk_base', 'trunk_mid1', 'trunk_mid2', 'trunk_tip'],
+    sides: 6, // Hexagon
+    baseRadius: 0.35,
+    tipRadius: 0.1
+  }));
+
+  // Right-hand parts are reflections of the left ones (see mirrorPart);
+  // they are only generated from scratch for an asymmetric skeleton.
+
+  // === 4. TUSKS (Pentagonal) ===
+  const leftTuskBones = ['tusk_left', 'tusk_left_tip'];
+  const leftTusk = makeFlat(generateTailGeometry(skeleton, {
+    ...TUSK_OPTS,
+    bones: leftTuskBones,
+    lengthScale: tuskScale
+  }));
+
+  // Tusk rings start at spine_base, which sits on the mirror plane.
+  const rightTusk = mirrorPart(leftTusk, skeleton, ['spine_base', ...leftTuskBones]) ||
+    makeFlat(generateTailGeometry(skeleton, {
+      ...TUSK_OPTS,
+      bones: ['tusk_right', 'tusk_right_tip'],
+      lengthScale: tuskScale
+    }));
+
+  // === 5. EARS (Blocky Flaps) ===
+  const leftEarBones = ['ear_left', 'ear_left_tip'];
+  const leftEar = makeFlat(generateLimbGeometry(skeleton, {
+    ...EAR_OPTS,
+    bones: leftEarBones
+  }));
+
+  const rightEar = mirrorPart(leftEar, skeleton, leftEarBones) ||
+    makeFlat(generateLimbGeometry(skeleton, {
+      ...EAR_OPTS,
+      bones: ['ear_right', 'ear_right_tip']
+    }));
+
+  // === 6. TAIL (Pentagonal) ===
+  const tailGeometry = makeFlat(generateTailGeometry(skeleton, {
+    bones: ['tail_base', 'tail_mid', 'tail_tip'],
+    sides: 5,
+    baseRadius: 0.15,
+    tipRadius: 0.05
+  }));
+
+  // === 7. LEGS (Hexagonal Pillars) ===
+  const legRadiiFront = LEG_RADII_FRONT.map((r) => r * legScale);
+  const legRadiiBack = LEG_RADII_BACK.map((r) => r * legScale);
+
+  const flBones = ['front_left_collarbone', 'front_left_upper', 'front_left_lower', 'front_left_foot'];
+  const fl = makeFlat(generateLimbGeometry(skeleton, {
+    bones: flBones,
+    radii: legRadiiFront,
+    ...LEG_OPTS
+  }));
+
+  const fr = mirrorPart(fl, skeleton, flBones) ||
+    makeFlat(generateLimbGeometry(skeleton, {
+      bones: ['front_right_collarbone', 'front_right_upper', 'front_right_lower', 'front_right_foot'],
+      radii: legRadiiFront,
+      ...LEG_OPTS
+    }));
+
+  const blBones = ['back_left_pelvis', 'back_left_upper', 'back_left_lower', 'back_left_foot'];
+  const bl = makeFlat(generateLimbGeometry(skeleton, {
+    bones: blBones,
+    radii: legRadiiBack,
+    ...LEG_OPTS
+  }));
+
+  const br = mirrorPart(bl, skeleton, blBones) ||
+    makeFlat(generateLimbGeometry(skeleton, {
+      bones: ['back_right_pelvis', 'back_right_upper', 'back_right_lower', 'back_right_foot'],
+      radii: legRadiiBack,
+      ...LEG_OPTS
+    }));
+
+  // === Merge ===
+  const mergedGeometry = mergeFlatParts([
+    torsoGeometry,
+    headGeometry,
+    trunkGeometry,
+    leftTusk,
+    rightTusk,
+    leftEar,
+    rightEar,
+    tailGeometry,
+    fl,
+    fr,
+    bl,
+    br
+  ]);
+
+  return mergedGeometry;
+}
+
+// Walking swings the legs, trunk and tail past the pose the bounds were
+// taken in; this much slack (as a fraction of the bounding radius) keeps the
+// elephant from being culled or boxed short mid-stride.
+const SKINNED_BOUNDS_SLACK = 0.2;
+
+/** Whether a geometry has any vertices yet (the worker placeholder has none). */
+export function hasVertices(geometry) {
+  const position = geometry.getAttribute('position');
+  return position !== undefined && position.count > 0;
+}
+
+/**
+ * Fits a SkinnedMesh's bounds to its current pose, plus some slack. three.js
+ * caches these (it skins every vertex on the CPU to compute them), and both
+ * frustum culling and BoxHelper read the cached values, so with the slack
+ * they hold for the whole walk cycle rather than just the first frame.
+ * Does nothing while the mesh still has an empty placeholder geometry.
+ */
+export function setSkinnedMeshBounds(mesh) {
+  if (!hasVertices(mesh.geometry)) return;
+  mesh.skeleton.update();
+  mesh.computeBoundingBox();
+  mesh.computeBoundingSphere();
+
+  const slack = mesh.boundingSphere.radius * SKINNED_BOUNDS_SLACK;
+  mesh.boundingSphere.radius += slack;
+  mesh.boundingBox.expandByScalar(slack);
+}
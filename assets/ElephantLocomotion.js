@@ -0,0 +1,377 @@
+
+// src/animals/Elephant/ElephantLocomotion.js
+
+import * as THREE from 'three';
+
+// Slots in ElephantLocomotion._springs (angle at k, velocity at k + 3)
+const SPRING_TRUNK = 0;
+const SPRING_EARS = 1;
+const SPRING_TAIL = 2;
+
+// Front legs lead the back legs by this phase offset (rad)
+const FRONT_LEAD = 0.3;
+const COS_FRONT_LEAD = Math.cos(FRONT_LEAD);
+const SIN_FRONT_LEAD = Math.sin(FRONT_LEAD);
+
+export class ElephantLocomotion {
+  constructor(elephant) {
+    this.elephant = elephant;
+    // Resolve every bone once so the per-frame code does plain property loads
+    // instead of string-keyed lookups. Missing bones stay undefined and are
+    // skipped exactly as before.
+    const bones = elephant.bones || {};
+    this._bSpineBase = bones['spine_base'];
+    this._bHead = bones['head'];
+    this._bSpineNeck = bones['spine_neck'];
+    this._bSpineMid = bones['spine_mid'];
+    this._bTrunkBase = bones['trunk_base'];
+    this._bTrunkMid = bones['trunk_mid'];
+    this._bTrunkTip = bones['trunk_tip'];
+    this._bEarLeft = bones['ear_left'];
+    this._bEarRight = bones['ear_right'];
+    this._bTrunkMid1 = bones['trunk_mid1'];
+    this._bTrunkMid2 = bones['trunk_mid2'];
+    this._bTailBase = bones['tail_base'];
+    this._bTailMid = bones['tail_mid'];
+    this._bTailTip = bones['tail_tip'];
+    this._bBackLeftUpperLeg = bones['back_left_upper_leg'];
+    this._bBackLeftLowerLeg = bones['back_left_lower_leg'];
+    this._bFrontLeftUpperLeg = bones['front_left_upper_leg'];
+    this._bFrontLeftLowerLeg = bones['front_left_lower_leg'];
+    this._bBackRightUpperLeg = bones['back_right_upper_leg'];
+    this._bBackRightLowerLeg = bones['back_right_lower_leg'];
+    this._bFrontRightUpperLeg = bones['front_right_upper_leg'];
+    this._bFrontRightLowerLeg = bones['front_right_lower_leg'];
+
+    this.state = 'idle';
+    this._stateTimer = 0;
+    this._stateTime = 0;
+    this.baseHeight = 0.45;       
+    this.walkSpeed = 0.5;         
+    this.wanderSpeed = 0.35;      
+    this.turnSpeed = 0.4;         
+    this.gaitDuration = 1.1;      
+    this.gaitPhase = 0;           
+    this.worldBoundsRadius = 5.0; 
+    this.idleTimer = 1.2;         
+    this.direction = new THREE.Vector3(0, 0, 1);
+    this.tempVec = new THREE.Vector3();
+    this._idleTime = 0;
+    this.tempQuat = new THREE.Quaternion();
+    // Trunk, ear and tail springs packed as [angles x3, velocities x3]
+    this._springs = new Float64Array(6);
+    this._springTargets = new Float64Array(3);
+  }
+
+  update(dt) {
+    const bones = this.elephant.bones;
+    const root = this._bSpineBase;
+    const mesh = this.elephant.mesh;
+
+    if (!bones || !root || !mesh) return;
+    this._stateTime += dt;
+    this._stateTimer -= dt;
+
+    if (this._stateTimer <= 0) {
+      if (this.state === 'idle') {
+        const r = Math.random();
+        if (r < 0.65) {
+          this.state = 'idle';
+          this._stateTimer = 4 + Math.random() * 3;
+        } else if (r < 0.9) {
+          this.state = 'wander';
+          this._stateTimer = 5 + Math.random() * 4;
+        } else {
+          this.state = 'curious';
+          this._stateTimer = 3 + Math.random() * 2;
+        }
+      } else {
+        this.state = 'idle';
+        this._stateTimer = 4 + Math.random() * 3;
+      }
+      this._stateTime = 0;
+      if (this.elephant.setState) this.elephant.setState(this.state);
+    }
+
+    switch (this.state) {
+      case 'wander':
+        this.updateWander(dt, root, mesh, bones);
+        break;
+      case 'curious':
+        this.updateCurious(dt, root, bones);
+        break;
+      case 'idle':
+      default:
+        this.updateIdle(dt, root, bones);
+        break;
+    }
+    this.applySecondaryMotion(dt, bones);
+  }
+
+  updateIdle(dt, root, bones) {
+    this._idleTime += dt;
+    const breathe = Math.sin(this._idleTime * 1.0 + 0.3) * 0.025;
+    const sway = Math.sin(this._idleTime * 0.3) * 0.02;
+    root.position.set(sway, this.baseHeight + breathe, 0);
+
+    const head = this._bHead;
+    const spineNeck = this._bSpineNeck;
+    const spineMid = this._bSpineMid;
+
+    if (spineMid) {
+      spineMid.rotation.x = 0.03 * Math.sin(this._idleTime * 0.7);
+      spineMid.rotation.z = 0.02 * Math.sin(this._idleTime * 0.5);
+    }
+    if (spineNeck) {
+      spineNeck.rotation.x = 0.05 + 0.03 * Math.sin(this._idleTime * 0.8);
+      spineNeck.rotation.y = 0.05 * Math.sin(this._idleTime * 0.6);
+    }
+    if (head) {
+      head.rotation.x = -0.15 + 0.05 * Math.sin(this._idleTime * 0.9);
+      head.rotation.y = 0.05 * Math.sin(this._idleTime * 0.7);
+    }
+  }
+
+  updateWander(dt, root, mesh, bones) {
+    const prevSpeed = this.walkSpeed;
+    this.walkSpeed = this.wanderSpeed;
+    this.updateWalk(dt, root, mesh, bones);
+    this.walkSpeed = prevSpeed;
+  }
+
+  updateCurious(dt, root, bones) {
+    root.position.set(0, this.baseHeight, 0);
+    root.rotation.z = 0.02 * Math.sin(this._stateTime * 1.5);
+
+    const spineNeck = this._bSpineNeck;
+    const head = this._bHead;
+    const trunkBase = this._bTrunkBase;
+    const trunkMid = this._bTrunkMid;
+    const trunkTip = this._bTrunkTip;
+
+    if (spineNeck) {
+      spineNeck.rotation.x = 0.1 + 0.05 * Math.sin(this._stateTime * 2.0);
+      spineNeck.rotation.y = 0.1 * Math.sin(this._stateTime * 1.0);
+    }
+    if (head) {
+      head.rotation.x = -0.05 + 0.07 * Math.sin(this._stateTime * 2.5);
+      head.rotation.y = 0.08 * Math.sin(this._stateTime * 1.7);
+    }
+    const lift = 0.3 + 0.1 * Math.sin(this._stateTime * 2.2);
+    if (trunkBase) {
+      trunkBase.rotation.x = -lift * 0.5;
+      trunkBase.rotation.y = 0.0;
+    }
+    if (trunkMid) {
+      trunkMid.rotation.x = -lift * 0.8;
+      trunkMid.rotation.y = 0.0;
+    }
+    if (trunkTip) {
+      trunkTip.rotation.x = -lift;
+      trunkTip.rotation.y = 0.0;
+    }
+    const earLeft = this._bEarLeft;
+    const earRight = this._bEarRight;
+    const flap = 0.15 * Math.sin(this._stateTime * 3.0);
+    if (earLeft) earLeft.rotation.z = flap;
+    if (earRight) earRight.rotation.z = -flap;
+  }
+
+  applySecondaryMotion(dt, bones) {
+    const speed = this.state === 'wander' ? this.wanderSpeed : 0;
+    const stiffness = 10.0;
+    const damping = 5.0;
+    const springs = this._springs;
+    const targets = this._springTargets;
+    targets[SPRING_TRUNK] = speed * 0.4;
+    targets[SPRING_EARS] = speed * 0.3;
+    targets[SPRING_TAIL] = speed * 0.5;
+
+    for (let k = 0; k < 3; k++) {
+      const acc = (targets[k] - springs[k]) * stiffness - springs[k + 3] * damping;
+      springs[k + 3] += acc * dt;
+      springs[k] += springs[k + 3] * dt;
+    }
+
+    const trunk = springs[SPRING_TRUNK];
+    const trunkBase = this._bTrunkBase;
+    const trunkMid1 = this._bTrunkMid1 || this._bTrunkMid;
+    const trunkMid2 = this._bTrunkMid2;
+    const trunkTip = this._bTrunkTip;
+    if (trunkBase) trunkBase.rotation.y += trunk * 0.7;
+    if (trunkMid1) trunkMid1.rotation.y += trunk * 0.5;
+    if (trunkMid2) trunkMid2.rotation.y += trunk * 0.35;
+    if (trunkTip) trunkTip.rotation.y += trunk * 0.2;
+
+    const ears = springs[SPRING_EARS];
+    const earLeft = this._bEarLeft;
+    const earRight = this._bEarRight;
+    if (earLeft) earLeft.rotation.z += ears;
+    if (earRight) earRight.rotation.z -= ears;
+
+    const tail = springs[SPRING_TAIL];
+    const tailBase = this._bTailBase;
+    const tailMid = this._bTailMid;
+    const tailTip = this._bTailTip;
+    if (tailBase) tailBase.rotation.y += tail * 0.6;
+    if (tailMid) tailMid.rotation.y += tail * 0.4;
+    if (tailTip) tailTip.rotation.y += tail * 0.2;
+  }
+
+  updateWalk(dt, root, mesh, bones) {
+    this._idleTime += dt; 
+    const TWO_PI = Math.PI * 2;
+    this.gaitPhase = (this.gaitPhase + (dt / this.gaitDuration) * TWO_PI) % TWO_PI;
+
+    const distFromOrigin = Math.sqrt(mesh.position.x ** 2 + mesh.position.z ** 2);
+    if (distFromOrigin > this.worldBoundsRadius) {
+      this.tempVec.set(-mesh.position.x, 0, -mesh.position.z).normalize();
+      this.turnToward(this.tempVec, dt);
+    } else if (Math.random() < dt * 0.2) {
+      const randomTurn = (Math.random() - 0.5) * this.turnSpeed * dt;
+      this.rotateDirection(randomTurn);
+    }
+
+    mesh.position.addScaledVector(this.direction, this.walkSpeed * dt);
+    const heading = Math.atan2(this.direction.x, this.direction.z);
+    root.rotation.y = heading;
+
+    const sinPhase = Math.sin(this.gaitPhase);
+    const cosPhase = Math.cos(this.gaitPhase);
+    const bobMain = 2 * sinPhase * cosPhase * 0.06; // sin(2 * phase)
+    const roll = sinPhase * 0.03;
+    root.position.set(0, this.baseHeight + bobMain, 0);
+    root.rotation.z = roll;
+
+    this.applyWalkPose(this.gaitPhase, bones);
+    this.applyTrunkWalk(bones, this._idleTime, this.gaitPhase);
+    this.applyEarWalk(bones, this._idleTime, this.gaitPhase);
+  }
+
+  rotateDirection(angle) {
+    const cos = Math.cos(angle);
+    const sin = Math.sin(angle);
+    const x = this.direction.x;
+    const z = this.direction.z;
+    this.direction.x = x * cos - z * sin;
+    this.direction.z = x * sin + z * cos;
+    this.direction.normalize();
+  }
+
+  turnToward(targetDir, dt) {
+    const currentHeading = Math.atan2(this.direction.x, this.direction.z);
+    const targetHeading = Math.atan2(targetDir.x, targetDir.z);
+    let delta = targetHeading - currentHeading;
+    if (delta > Math.PI) delta -= Math.PI * 2;
+    if (delta < -Math.PI) delta += Math.PI * 2;
+    const maxTurn = this.turnSpeed * dt;
+    delta = THREE.MathUtils.clamp(delta, -maxTurn, maxTurn);
+    this.rotateDirection(delta);
+  }
+
+  applyWalkPose(phase, bones) {
+    // The right legs run half a cycle behind the left ones and the front
+    // legs lead the back ones by 0.3 rad, so every swing is a linear
+    // combination of sin/cos(phase): sin(x + PI) = -sin(x) and
+    // sin(x + 0.3) = sin(x) cos(0.3) + cos(x) sin(0.3).
+    const sinPhase = Math.sin(phase);
+    const cosPhase = Math.cos(phase);
+
+    const swingAmpFront = 0.4;  
+    const swingAmpBack = 0.5;   
+    const kneeBendFront = 0.7;
+    const kneeBendBack = 0.9;
+
+    const swingLeft = sinPhase;
+    const swingRight = -sinPhase;
+    const swingLeftFront = sinPhase * COS_FRONT_LEAD + cosPhase * SIN_FRONT_LEAD;
+    const swingRightFront = -swingLeftFront;
+
+    const blUpper = this._bBackLeftUpperLeg;
+    const blLower = this._bBackLeftLowerLeg;
+    if (blUpper && blLower) {
+      blUpper.rotation.x = swingAmpBack * swingLeft;
+      blLower.rotation.x = kneeBendBack * Math.max(0, -swingLeft);
+    }
+
+    const flUpper = this._bFrontLeftUpperLeg;
+    const flLower = this._bFrontLeftLowerLeg;
+    if (flUpper && flLower) {
+      flUpper.rotation.x = swingAmpFront * swingLeftFront;
+      flLower.rotation.x = kneeBendFront * Math.max(0, -swingLeftFront);
+    }
+
+    const brUpper = this._bBackRightUpperLeg;
+    const brLower = this._bBackRightLowerLeg;
+    if (brUpper && brLower) {
+      brUpper.rotation.x = swingAmpBack * swingRight;
+      brLower.rotation.x = kneeBendBack * Math.max(0, -swingRight);
+    }
+
+    const frUpper = this._bFrontRightUpperLeg;
+    const frLower = this._bFrontRightLowerLeg;
+    if (frUpper && frLower) {
+      frUpper.rotation.x = swingAmpFront * swingRightFront;
+      frLower.rotation.x = kneeBendFront * Math.max(0, -swingRightFront);
+    }
+
+    const spineMid = this._bSpineMid;
+    const spineNeck = this._bSpineNeck;
+    const head = this._bHead;
+
+    const bodyPitch = sinPhase * 0.03;
+    const bodyYaw = Math.sin(phase * 0.5) * 0.02;
+
+    if (spineMid) {
+      spineMid.rotation.x = bodyPitch;
+      spineMid.rotation.y = bodyYaw * 0.7;
+    }
+    if (spineNeck) {
+      spineNeck.rotation.x = 0.1 + bodyPitch * 0.5;
+      spineNeck.rotation.y = bodyYaw;
+    }
+    if (head) {
+      head.rotation.x = -0.2 + bodyPitch * -0.3;
+      head.rotation.y = bodyYaw * 1.2;
+    }
+  }
+
+  applyTrunkWalk(bones, t, phase) {
+    const trunkBase = this._bTrunkBase;
+    const trunkMid = this._bTrunkMid;
+    const trunkTip = this._bTrunkTip;
+    if (!trunkBase && !trunkMid && !trunkTip) return;
+
+    const gaitSway = Math.sin(phase) * 0.25;      
+    const gaitDip = Math.sin(phase * 2.0) * 0.1;  
+    const idleSway = Math.sin(t * 0.6) * 0.08;
+    const idleDip = Math.sin(t * 0.8) * 0.05;
+    const sway = gaitSway + idleSway;
+    const dip = gaitDip + idleDip;
+
+    if (trunkBase) {
+      trunkBase.rotation.y = sway * 0.8;
+      trunkBase.rotation.x = dip * 0.4;
+    }
+    if (trunkMid) {
+      trunkMid.rotation.y = sway * 0.6;
+      trunkMid.rotation.x = dip * 0.8;
+    }
+    if (trunkTip) {
+      trunkTip.rotation.y = sway * 0.5;
+      trunkTip.rotation.x = dip * 1.0;
+    }
+  }
+
+  applyEarWalk(bones, t, phase) {
+    const earLeft = this._bEarLeft;
+    const earRight = this._bEarRight;
+    if (!earLeft && !earRight) return;
+    const gaitFlap = Math.sin(phase * 2.0) * 0.18;
+    const idleFlap = Math.sin(t * 0.9) * 0.08;
+    const totalLeft = gaitFlap + idleFlap;
+    const totalRight = gaitFlap + idleFlap * 0.9;
+    if (earLeft) earLeft.rotation.z = totalLeft;
+    if (earRight) earRight.rotation.z = -totalRight;
+  }
+}
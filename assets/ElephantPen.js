@@ -0,0 +1,195 @@
+
+// src/animals/ElephantPen.js
+
+import { ElephantCreature } from './ElephantCreature.js';
+import * as THREE from 'three';
+
+// setFromObject walks the whole creature and re-uploads the helper's lines,
+// so the bounding box is refreshed only every few frames.
+const BBOX_REFRESH_FRAMES = 10;
+
+// Off-screen elephants tick every OFFSCREEN_UPDATE_FRAMES frames and ones
+// beyond throttleDistance every FAR_UPDATE_FRAMES, with the skipped time
+// carried over so their animation stays in step.
+const OFFSCREEN_UPDATE_FRAMES = 4;
+const FAR_UPDATE_FRAMES = 2;
+const _frustum = new THREE.Frustum();
+const _projScreenMatrix = new THREE.Matrix4();
+const _cameraPos = new THREE.Vector3();
+const _elephantPos = new THREE.Vector3();
+
+// Every pen looks the same, so materials are shared by all of them and
+// geometries by pens of the same size. Lights are added once per scene.
+const _wallMaterialYZ = new THREE.MeshStandardMaterial({
+  color: 0x222324,
+  roughness: 0.8,
+  metalness: 0.0,
+  side: THREE.FrontSide
+});
+const _wallMaterialXY = _wallMaterialYZ.clone();
+_wallMaterialXY.color.set(0x1b1c1d);
+const _padMaterial = new THREE.MeshStandardMaterial({ color: 0x8a8a88, roughness: 0.7 });
+const _penResources = new Map();
+const _litScenes = new WeakSet();
+
+function sharedPenResources(gridSize, gridDivisions, radius, padHeight) {
+  const key = `${gridSize}|${gridDivisions}|${radius}|${padHeight}`;
+  let resources = _penResources.get(key);
+  if (!resources) {
+    const grid = new THREE.GridHelper(gridSize, gridDivisions, 0x222222, 0x888888);
+    resources = {
+      gridGeometry: grid.geometry,
+      gridMaterial: grid.material,
+      wallGeometry: new THREE.PlaneGeometry(gridSize, gridSize),
+      padGeometry: new THREE.CylinderGeometry(radius, radius, padHeight, 48)
+    };
+    _penResources.set(key, resources);
+  }
+  return resources;
+}
+
+// The first pen in a scene places the rig around itself; later pens share it
+// rather than adding another five lights and a second shadow map.
+function addSceneLights(scene, position, padHeight) {
+  if (_litScenes.has(scene)) return;
+  _litScenes.add(scene);
+
+  const rig = new THREE.Group();
+  rig.position.copy(position);
+  const hemiLight = new THREE.HemisphereLight(0xffffff, 0x404040, 0.85);
+  rig.add(hemiLight);
+  const ambientLight = new THREE.AmbientLight(0xffffff, 0.25);
+  rig.add(ambientLight);
+  const lightTarget = new THREE.Object3D();
+  lightTarget.position.set(0, padHeight + 1.2, 0);
+  rig.add(lightTarget);
+  const keyLight = new THREE.DirectionalLight(0xffffff, 0.7);
+  keyLight.position.set(4, 5, 4);
+  keyLight.target = lightTarget;
+  keyLight.castShadow = true;
+  rig.add(keyLight);
+  const fillLight = new THREE.DirectionalLight(0xffffff, 0.45);
+  fillLight.position.set(-3, 3, 2);
+  fillLight.target = lightTarget;
+  rig.add(fillLight);
+  const rimLight = new THREE.DirectionalLight(0xffffff, 0.4);
+  rimLight.position.set(-2, 4.5, -4);
+  rimLight.target = lightTarget;
+  rig.add(rimLight);
+  scene.add(rig);
+}
+
+export class ElephantPen {
+  constructor(scene, options = {}) {
+    this.scene = scene;
+    this.options = options;
+    this.radius = options.radius || 2.0;
+    this.padHeight = options.padHeight || 0.17;
+    this.markerRadius = options.markerRadius || 0.13;
+    this.markerHeight = options.markerHeight || 0.13;
+    this.markerColor = options.markerColor || 0x227bc4;
+    this.lineColor = options.lineColor || 0x166597;
+    this.position = options.position || new THREE.Vector3(0, 0, 0);
+    const gridSize = this.radius * 2.2;
+    const gridDivisions = 22;
+
+    this.group = new THREE.Group();
+    this.group.position.copy(this.position);
+
+    const wallSize = gridSize;
+    const shared = sharedPenResources(gridSize, gridDivisions, this.radius, this.padHeight);
+
+    const gridXZFloor = new THREE.LineSegments(shared.gridGeometry, shared.gridMaterial);
+    gridXZFloor.position.set(0, 0.01, 0);
+    gridXZFloor.receiveShadow = true;
+    this.group.add(gridXZFloor);
+
+    const wallYZ = new THREE.Mesh(shared.wallGeometry, _wallMaterialYZ);
+    wallYZ.position.set(-wallSize / 2, wallSize / 2, 0);
+    wallYZ.rotation.y = Math.PI / 2;
+    wallYZ.receiveShadow = true;
+    this.group.add(wallYZ);
+
+    const wallXY = new THREE.Mesh(shared.wallGeometry, _wallMaterialXY);
+    wallXY.position.set(0, wallSize / 2, -wallSize / 2);
+    wallXY.receiveShadow = true;
+    this.group.add(wallXY);
+
+    const axesLen = this.radius * 1.5;
+    const axesHelper = new THREE.AxesHelper(axesLen);
+    axesHelper.position.set(0, this.padHeight + 0.02, 0);
+    this.group.add(axesHelper);
+
+    const pad = new THREE.Mesh(shared.padGeometry, _padMaterial);
+    pad.position.set(0, this.padHeight / 2, 0);
+    pad.receiveShadow = true;
+    pad.castShadow = true;
+    this.group.add(pad);
+
+    addSceneLights(scene, this.position, this.padHeight);
+
+    const elephantScale = typeof options.scale === 'number' ? options.scale : 0.75;
+    this.Elephant = new ElephantCreature({ scale: elephantScale, debug: !!options.debugElephant });
+    const elephantY = this.padHeight + 1.5;
+    this.Elephant.position.set(0, elephantY, 0);
+    const defaultYaw = Math.PI * 0.3;
+    this.Elephant.rotation.y = typeof options.rotationY === 'number' ? options.rotationY : defaultYaw;
+    this.group.add(this.Elephant);
+    if (this.Elephant.mesh) {
+      this.Elephant.mesh.castShadow = true;
+      this.Elephant.mesh.receiveShadow = true;
+    }
+
+    this.camera = options.camera || null;
+    this.throttleDistance = options.throttleDistance || Infinity;
+    this._pendingDt = 0;
+    this._updateFrame = 0;
+
+    this.turntable = !!options.turntable;
+    this.bboxHelper = new THREE.BoxHelper(this.Elephant, 0xffff66);
+    this.bboxHelper.material.transparent = true;
+    this.bboxHelper.material.opacity = 0.35;
+    this.bboxHelper.visible = options.showBoundingBox !== undefined ? !!options.showBoundingBox : true;
+    this.group.add(this.bboxHelper);
+    this._bboxFrame = 0;
+
+    scene.add(this.group);
+  }
+
+  _addAxisLabel(text, x, y, z, color, group) { }
+
+  setCamera(camera) {
+    this.camera = camera;
+  }
+
+  _updateInterval() {
+    const camera = this.camera;
+    const mesh = this.Elephant.mesh;
+    if (!camera || !mesh) return 1;
+    _projScreenMatrix.multiplyMatrices(camera.projectionMatrix, camera.matrixWorldInverse);
+    _frustum.setFromProjectionMatrix(_projScreenMatrix);
+    if (!_frustum.intersectsObject(mesh)) return OFFSCREEN_UPDATE_FRAMES;
+    camera.getWorldPosition(_cameraPos);
+    this.Elephant.getWorldPosition(_elephantPos);
+    return _cameraPos.distanceTo(_elephantPos) > this.throttleDistance ? FAR_UPDATE_FRAMES : 1;
+  }
+
+  update(dt) {
+    if (this.Elephant && typeof this.Elephant.update === 'function') {
+      this._pendingDt += dt;
+      if (++this._updateFrame >= this._updateInterval()) {
+        this.Elephant.update(this._pendingDt);
+        this._pendingDt = 0;
+        this._updateFrame = 0;
+      }
+    }
+    if (this.bboxHelper && this.bboxHelper.visible && this.Elephant) {
+      if (this._bboxFrame++ % BBOX_REFRESH_FRAMES === 0) {
+        this.bboxHelper.setFromObject(this.Elephant);
+      }
+    }
+    if (this.turntable && this.Elephant) {
+      this.Elephant.rotation.y += dt * 0.3;
+    }
+  }
+}
@@ -0,0 +1,129 @@
+
+// src/animals/Elephant/ElephantSkinNode.js
+
+import * as THREE from 'three'; 
+import { Fn, texture, uv, positionLocal, normalLocal, color, float, mix, add, nodeObject } from '../../../libs/three.tsl.js';
+import { MeshStandardNodeMaterial, SkinningNode } from '../../../libs/three.webgpu.js';
+import { elephantSkinCanvasTexture } from './ElephantSkinTexture.js';
+
+/**
+ * The body generators weight every vertex to at most two bones (skinWeight.z
+ * and .w are always 0), so only skinIndex.xy are blended: half the bone
+ * matrix fetches and multiplies of the stock four-bone SkinningNode.
+ */
+class TwoBoneSkinningNode extends SkinningNode {
+  getSkinnedPosition(boneMatrices = this.boneMatricesNode, position = this.positionNode) {
+    const { skinIndexNode, skinWeightNode, bindMatrixNode, bindMatrixInverseNode } = this;
+
+    const boneMatX = boneMatrices.element(skinIndexNode.x);
+    const boneMatY = boneMatrices.element(skinIndexNode.y);
+    const skinVertex = bindMatrixNode.mul(position);
+
+    const skinned = add(
+      boneMatX.mul(skinWeightNode.x).mul(skinVertex),
+      boneMatY.mul(skinWeightNode.y).mul(skinVertex)
+    );
+    return bindMatrixInverseNode.mul(skinned).xyz;
+  }
+
+  getSkinnedNormal(boneMatrices = this.boneMatricesNode, normal = normalLocal) {
+    const { skinIndexNode, skinWeightNode, bindMatrixNode, bindMatrixInverseNode } = this;
+
+    const boneMatX = boneMatrices.element(skinIndexNode.x);
+    const boneMatY = boneMatrices.element(skinIndexNode.y);
+
+    let skinMatrix = add(
+      skinWeightNode.x.mul(boneMatX),
+      skinWeightNode.y.mul(boneMatY)
+    );
+    skinMatrix = bindMatrixInverseNode.mul(skinMatrix).mul(bindMatrixNode);
+    return skinMatrix.transformDirection(normal).xyz;
+  }
+}
+
+class ElephantSkinMaterial extends MeshStandardNodeMaterial {
+  setupPosition(builder) {
+    const { object, geometry } = builder;
+    const plainSkinning = object.isSkinnedMesh === true &&
+      !geometry.morphAttributes.position && !geometry.morphAttributes.normal &&
+      !geometry.morphAttributes.color && !this.displacementMap &&
+      !object.isBatchedMesh && !object.isInstancedMesh && this.positionNode === null;
+    // Anything beyond plain skinning takes the stock path.
+    if (!plainSkinning) return super.setupPosition(builder);
+
+    nodeObject(new TwoBoneSkinningNode(object)).toStack();
+    return positionLocal;
+  }
+}
+
+/**
+ * ElephantSkinNode (v1.2 Low Poly / Matte Edition)
+ *
+ * Modified for a "MetaMask" style:
+ * - High roughness (Matte/Paper/Clay look)
+ * - Reduced texture noise intensity (so geometry facets are the hero)
+ */
+export function createElephantSkinMaterial(options = {}) {
+  const baseColorHex =
+    options.bodyColor !== undefined ? options.bodyColor : 0x999b9f;
+
+  const material = new ElephantSkinMaterial({
+    skinning: true
+  });
+
+  const baseCol = color(baseColorHex);
+  const tuskMask = positionLocal.z.mul(0.6).add(0.4);
+
+  // The whole colour graph lives in one Fn scope so it is emitted as a single
+  // shader function, with positionLocal read once into a local.
+  material.colorNode = Fn(() => {
+    const pos = positionLocal.toVar();
+
+    // 1. Low-frequency shading (simplified)
+    const p = pos.mul(0.22);
+    const verticalBands = p.y.mul(3.0).sin().abs();
+    const horizontalBands = p.x.mul(2.0).sin().abs();
+
+    // Reduced intensity of bands for cleaner look
+    const macroMask = verticalBands.add(horizontalBands).mul(0.3);
+
+    // Less contrast in the macro color
+    const macroColor = baseCol.mul(macroMask.mul(0.1).add(0.9));
+
+    // 2. Texture Detail (Greatly Reduced for Low Poly style)
+    // Make the texture very subtle, mostly just a slight grain
+    const canvasRGB = texture(elephantSkinCanvasTexture, uv()).rgb;
+    const canvasBoost = canvasRGB.mul(0.15).add(0.9);
+
+    // 3. Underside Darkening (Subtle AO)
+    const undersideFactor = pos.y.mul(-0.5).mul(0.1).add(0.95);
+
+    // 4. Region Colors (Kept for visual interest)
+    const trunkMask = pos.z.mul(0.5).add(0.35)
+      .mul(pos.y.mul(-0.25).add(0.75));
+    const legMask = pos.y.mul(-1.0).mul(0.35).add(0.65);
+    const toeMask = pos.y.mul(-2.0).add(1.4);
+
+    const mixTrunk = mix(macroColor, baseCol.mul(0.92), trunkMask);
+    const mixLeg = mix(mixTrunk, baseCol.mul(1.05), legMask);
+    const mixTusk = mix(mixLeg, baseCol.mul(1.6), tuskMask); // Keep tusks bright
+    const mixToe = mix(mixTusk, baseCol.mul(1.15), toeMask);
+
+    return mixToe.mul(canvasBoost).mul(undersideFactor);
+  })();
+
+  // 5. Roughness & Metalness (Matte/Clay look)
+  // High roughness to avoid "plastic" shininess and look more like paper/clay
+  const baseRough = float(0.85); 
+  const smoothRough = float(0.5); // Slightly smoother tusks
+  
+  material.roughnessNode = mix(baseRough, smoothRough, tuskMask);
+
+  material.metalnessNode = float(0.0); // No metalness for this art style
+
+  // Subtle emissive to prevent total blackness in shadows
+  material.emissive = new THREE.Color(0x222222);
+  material.emissiveIntensity = 0.2;
+
+  return material;
+}
@@ -0,0 +1,72 @@
+// src/animals/Elephant/ElephantSkinPattern.js
+//
+// Paints the procedural elephant skin onto any 2D context. Nothing here
+// touches three.js or the DOM, so the same code runs on a page canvas and on
+// an OffscreenCanvas inside src/workers/skinTextureWorker.js.
+
+const SKIN_BASE_RGB = [115, 115, 120];
+export const DEFAULT_SKIN_SEED = 0x2f6b1d;
+
+// Patch colours vary by a whole-number delta of 10-19 in either direction,
+// so every fill style the loop can ask for is built once up front.
+const PATCH_FILL_STYLES = (() => {
+  const [baseR, baseG, baseB] = SKIN_BASE_RGB;
+  const styles = [];
+  for (const dark of [false, true]) {
+    for (let delta = 10; delta < 20; delta++) {
+      const rCol = baseR + (dark ? -delta : delta);
+      const gCol = baseG + (dark ? -delta : delta * 0.9);
+      const bCol = baseB + (dark ? -delta * 0.8 : delta * 0.5);
+      styles.push(`rgba(${rCol|0},${gCol|0},${bCol|0},0.12)`);
+    }
+  }
+  return styles;
+})();
+
+// mulberry32: small, fast and good enough for scattering patches. A fixed
+// seed makes the texture identical on every load.
+function mulberry32(a) {
+  return function () {
+    a |= 0;
+    a = a + 0x6D2B79F5 | 0;
+    let t = Math.imul(a ^ a >>> 15, 1 | a);
+    t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+    return ((t ^ t >>> 14) >>> 0) / 4294967296;
+  };
+}
+
+export function paintElephantSkin(ctx, size, seed = DEFAULT_SKIN_SEED) {
+  const random = mulberry32(seed);
+  const [baseR, baseG, baseB] = SKIN_BASE_RGB;
+  ctx.fillStyle = `rgb(${baseR},${baseG},${baseB})`;
+  ctx.fillRect(0, 0, size, size);
+  
+  // (Reduced visual noise for low poly version)
+  // Patches are sorted into their colour bins first, then each bin is drawn
+  // as one path with a single fill, so fillStyle changes once per bin rather
+  // than once per patch. Overlaps within a bin no longer stack their alpha.
+  const patchCount = 100;
+  const bins = PATCH_FILL_STYLES.map(() => []);
+  for (let i = 0; i < patchCount; i++) {
+    const cx = random() * size;
+    const cy = random() * size;
+    const r = (size / 20) + random() * (size / 10);
+    const dark = random() < 0.5;
+    const step = (random() * 10) | 0;
+    bins[(dark ? 10 : 0) + step].push(cx, cy, r, random()*Math.PI);
+  }
+
+  for (let b = 0; b < bins.length; b++) {
+    const patches = bins[b];
+    if (patches.length === 0) continue;
+    ctx.fillStyle = PATCH_FILL_STYLES[b];
+    ctx.beginPath();
+    for (let k = 0; k < patches.length; k += 4) {
+      const cx = patches[k], cy = patches[k + 1], r = patches[k + 2], rotation = patches[k + 3];
+      // Start each sub-path on its own ellipse so no joining edge is filled.
+      ctx.moveTo(cx + r * Math.cos(rotation), cy + r * Math.sin(rotation));
+      ctx.ellipse(cx, cy, r, r * 0.7, rotation, 0, Math.PI * 2);
+    }
+    ctx.fill();
+  }
+}
@@ -0,0 +1,83 @@
+// src/animals/Elephant/ElephantSkinTexture.js
+import * as THREE from 'three';
+import { DEFAULT_SKIN_SEED, paintElephantSkin } from './ElephantSkinPattern.js';
+
+export function createElephantSkinCanvasTexture(options = {}) {
+  const size = options.size || 1024;
+  const seed = options.seed !== undefined ? options.seed : DEFAULT_SKIN_SEED;
+
+  // Painting a full-size canvas stalls the first frame, so where
+  // OffscreenCanvas workers exist the texture starts as a 1x1 swatch of the
+  // base colour and the painted bitmap is swapped in when it arrives. Pass
+  // worker: false to paint inline.
+  const useWorker = options.worker !== false &&
+    typeof Worker !== 'undefined' && typeof OffscreenCanvas !== 'undefined';
+
+  const canvas = document.createElement('canvas');
+  canvas.width = useWorker ? 1 : size;
+  canvas.height = useWorker ? 1 : size;
+  const ctx = canvas.getContext('2d');
+  if (!ctx) {
+    const fallback = new THREE.CanvasTexture(canvas);
+    fallback.needsUpdate = true;
+    return fallback;
+  }
+  paintElephantSkin(ctx, canvas.width, seed);
+
+  const texture = new THREE.CanvasTexture(canvas);
+  texture.anisotropy = 4;
+  texture.wrapS = THREE.ClampToEdgeWrapping;
+  texture.wrapT = THREE.ClampToEdgeWrapping;
+  // The pattern is a few large soft blobs, so it needs no mip chain; skipping
+  // it saves a third of the upload and the mip generation.
+  texture.generateMipmaps = false;
+  texture.minFilter = THREE.LinearFilter;
+  if (texture.colorSpace !== undefined) {
+    texture.colorSpace = THREE.SRGBColorSpace;
+  }
+  // Everything that affects the upload is set above, so it happens once.
+  texture.needsUpdate = true;
+  if (useWorker) paintInWorker(texture, canvas, size, seed);
+  return texture;
+}
+
+// The renderer keeps the GPU texture allocated at the 1x1 size of the first
+// upload and only copies into it on later updates, so release it before the
+// full-size image goes in; the next upload then allocates at the new size.
+function swapImage(texture, image) {
+  texture.dispose();
+  texture.image = image;
+  texture.needsUpdate = true;
+}
+
+function paintInWorker(texture, canvas, size, seed) {
+  const worker = new Worker(new URL('../../workers/skinTextureWorker.js', import.meta.url), { type: 'module' });
+  const fallback = (reason) => {
+    console.warn('Elephant skin worker failed, painting on the main thread:', reason);
+    canvas.width = size;
+    canvas.height = size;
+    paintElephantSkin(canvas.getContext('2d'), size, seed);
+    swapImage(texture, canvas);
+  };
+
+  worker.onmessage = ({ data }) => {
+    worker.terminate();
+    if (data.error) {
+      fallback(data.error);
+      return;
+    }
+    // ImageBitmaps cannot be flipped on upload; the pattern is random, so
+    // its orientation does not matter.
+    texture.flipY = false;
+    swapImage(texture, data.bitmap);
+  };
+  worker.onerror = (event) => {
+    worker.terminate();
+    event.preventDefault();
+    fallback(event.message);
+  };
+
+  worker.postMessage({ size, seed });
+}
+
+export const elephantSkinCanvasTexture = createElephantSkinCanvasTexture();
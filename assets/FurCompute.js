@@ -0,0 +1,202 @@
+
+// src/animals/bodyParts/FurCompute.js
+import * as THREE from 'three';
+import {
+  Fn, instancedArray, instanceIndex, instancedBufferAttribute, uniform,
+  positionLocal, normalLocal, positionGeometry, normalGeometry,
+  vec3, vec4, float, max, select
+} from '../../../libs/three.tsl.js';
+import { MeshStandardNodeMaterial } from '../../../libs/three.webgpu.js';
+import { DEFAULT_GRAVITY, getVertexSkinMatrix } from './FurGenerator.js';
+
+/**
+ * Places each strand from the simulated root/tip buffers instead of
+ * instanceMatrix: the unit cylinder's +Y is rotated onto root->tip (the
+ * shortest-arc rotation, as Quaternion.setFromUnitVectors(+Y, dir)) and
+ * stretched to the strand length.
+ */
+class FurStrandMaterial extends MeshStandardNodeMaterial {
+  constructor(rootNode, tipNode, parameters) {
+    super(parameters);
+    this.rootNode = rootNode;
+    this.tipNode = tipNode;
+  }
+
+  setupPosition() {
+    const root = this.rootNode.element(instanceIndex).xyz.toVar();
+    const d = this.tipNode.element(instanceIndex).xyz.sub(root).toVar();
+    const len = d.length().toVar();
+    const dir = d.div(max(len, 1e-8)).toVar();
+    const r = dir.y.add(1);
+    const k = float(1).div(max(r, 1e-8));
+    // Columns of the rotation; pointing straight down is a half turn about Z
+    const down = r.lessThan(1e-6);
+    const col0 = select(down, vec3(-1, 0, 0),
+      vec3(dir.x.mul(dir.x).mul(k).oneMinus(), dir.x.negate(), dir.x.mul(dir.z).mul(k).negate()));
+    const col2 = select(down, vec3(0, 0, 1),
+      vec3(dir.x.mul(dir.z).mul(k).negate(), dir.z.negate(), dir.z.mul(dir.z).mul(k).oneMinus()));
+
+    const p = positionGeometry;
+    positionLocal.assign(root.add(col0.mul(p.x)).add(dir.mul(p.y.mul(len))).add(col2.mul(p.z)));
+    const n = normalGeometry;
+    normalLocal.assign(col0.mul(n.x).add(dir.mul(n.y.div(max(len, 1e-8)))).add(col2.mul(n.z)).normalize());
+    return positionLocal;
+  }
+}
+
+/**
+ * Places each strand from three instanced vec4 rows (a 3x4 row-major affine
+ * matrix) instead of the 4x4 instanceMatrix.
+ */
+class FurRowsMaterial extends MeshStandardNodeMaterial {
+  constructor(rowBuffer, parameters) {
+    super(parameters);
+    this.rowBuffer = rowBuffer;
+  }
+
+  setupPosition() {
+    const row0 = instancedBufferAttribute(this.rowBuffer, 'vec4', 12, 0);
+    const row1 = instancedBufferAttribute(this.rowBuffer, 'vec4', 12, 4);
+    const row2 = instancedBufferAttribute(this.rowBuffer, 'vec4', 12, 8);
+
+    const p = vec4(positionGeometry, 1);
+    positionLocal.assign(vec3(row0.dot(p), row1.dot(p), row2.dot(p)));
+    // The columns are orthogonal (rotation times a Y stretch), so the normal
+    // matrix scales each column by 1 / |column|^2; only Y is stretched.
+    const c0 = vec3(row0.x, row1.x, row2.x);
+    const c1 = vec3(row0.y, row1.y, row2.y).toVar();
+    const c2 = vec3(row0.z, row1.z, row2.z);
+    const n = normalGeometry;
+    normalLocal.assign(c0.mul(n.x).add(c1.mul(n.y.div(max(c1.dot(c1), 1e-16)))).add(c2.mul(n.z)).normalize());
+    return positionLocal;
+  }
+}
+
+/**
+ * Swaps a fur mesh's 4x4 instanceMatrix for 3x4 affine rows: updateStrands
+ * then writes and uploads 48 bytes per strand instead of 64. The rows live
+ * in one interleaved buffer that the node material reads as three vec4
+ * attributes, so this needs a WebGPURenderer (either backend). Returns false
+ * and keeps instanceMatrix for any other renderer, or for batched fur.
+ *
+ * @param {THREE.InstancedMesh} furMesh - Mesh returned by generateFurMesh.
+ * @param {object} renderer - The renderer that will draw the fur.
+ * @returns {boolean} Whether the row layout was installed.
+ */
+export function enableFurAffineRows(furMesh, renderer) {
+  if (!furMesh.isInstancedMesh || !renderer || renderer.isWebGPURenderer !== true) return false;
+
+  const rows = new Float32Array(furMesh.count * 12);
+  // Start every strand at identity, as instanceMatrix does
+  for (let o = 0; o < rows.length; o += 12) rows[o] = rows[o + 5] = rows[o + 10] = 1;
+  const rowBuffer = new THREE.InstancedInterleavedBuffer(rows, 12, 1);
+  rowBuffer.setUsage(THREE.DynamicDrawUsage);
+
+  const old = furMesh.material;
+  furMesh.material = new FurRowsMaterial(rowBuffer, {
+    color: old.color,
+    roughness: old.roughness,
+    metalness: old.metalness,
+    side: old.side,
+    transparent: old.transparent,
+    opacity: old.opacity,
+    flatShading: old.flatShading,
+  });
+  old.dispose();
+  // instanceMatrix no longer tracks the strands, so its bounds are stale
+  furMesh.frustumCulled = false;
+  furMesh.userData.instanceRows = rowBuffer;
+  return true;
+}
+
+/**
+ * Moves a fur mesh's strand simulation onto the GPU. Strand state is copied
+ * into storage buffers, one compute dispatch per update integrates every
+ * strand (spring, damping, gravity, then the Follow-The-Leader length step)
+ * and the material builds each strand's transform from those buffers, so
+ * instanceMatrix is no longer written. updateStrands keeps its signature;
+ * the CPU only blends the skin matrix and sets uniforms. The CPU copy in
+ * furMesh.userData.strands stops advancing once this is enabled.
+ *
+ * Needs a WebGPURenderer (either backend). Returns false and leaves the CPU
+ * path in place for any other renderer, or for batched fur.
+ *
+ * @param {THREE.InstancedMesh} furMesh - Mesh returned by generateFurMesh.
+ * @param {object} renderer - The renderer that will draw the fur.
+ * @returns {boolean} Whether the GPU path was installed.
+ */
+export function enableFurCompute(furMesh, renderer) {
+  if (!furMesh.isInstancedMesh || !renderer || renderer.isWebGPURenderer !== true) return false;
+
+  const strands = furMesh.userData.strands;
+  const count = strands.count;
+
+  // vec4 slots: xyz plus a spare lane (the strand length rides in rest.w)
+  const pack = (xyz, w) => {
+    const out = new Float32Array(count * 4);
+    for (let i = 0; i < count; ++i) {
+      out[i * 4] = xyz[i * 3];
+      out[i * 4 + 1] = xyz[i * 3 + 1];
+      out[i * 4 + 2] = xyz[i * 3 + 2];
+      out[i * 4 + 3] = w ? w[i] : 0;
+    }
+    return out;
+  };
+  const restBuffer = instancedArray(pack(strands.restRoot, strands.lengths), 'vec4');
+  const normalBuffer = instancedArray(pack(strands.normal), 'vec4');
+  const rootBuffer = instancedArray(pack(strands.root), 'vec4');
+  const tipBuffer = instancedArray(pack(strands.tip), 'vec4');
+  const velocityBuffer = instancedArray(pack(strands.velocity), 'vec4');
+
+  const skinMatrix = uniform(new THREE.Matrix4());
+  const dtNode = uniform(0);
+  const stiffnessNode = uniform(36);
+  const dampingNode = uniform(8);
+  const gravityNode = uniform(DEFAULT_GRAVITY.clone());
+
+  const simulate = Fn(() => {
+    const rest = restBuffer.element(instanceIndex);
+    const length = rest.w;
+    const root = skinMatrix.mul(vec4(rest.xyz, 1)).xyz.toVar();
+    const normal = normalBuffer.element(instanceIndex).xyz;
+    const tip = tipBuffer.element(instanceIndex).xyz.toVar();
+    const vel = velocityBuffer.element(instanceIndex).xyz.toVar();
+
+    const force = root.add(normal.mul(length)).sub(tip).mul(stiffnessNode)
+      .sub(vel.mul(dampingNode)).add(gravityNode);
+    vel.addAssign(force.mul(dtNode));
+    tip.addAssign(vel.mul(dtNode));
+
+    // Follow-The-Leader, as in FurStrands.update
+    const d = tip.sub(root).toVar();
+    tip.assign(root.add(d.mul(length.div(d.dot(d).add(1e-20).sqrt()))));
+
+    rootBuffer.element(instanceIndex).assign(vec4(root, 1));
+    tipBuffer.element(instanceIndex).assign(vec4(tip, 1));
+    velocityBuffer.element(instanceIndex).assign(vec4(vel, 0));
+  })().compute(count);
+
+  const old = furMesh.material;
+  furMesh.material = new FurStrandMaterial(rootBuffer, tipBuffer, {
+    color: old.color,
+    roughness: old.roughness,
+    metalness: old.metalness,
+    side: old.side,
+    transparent: old.transparent,
+    opacity: old.opacity,
+    flatShading: old.flatShading,
+  });
+  old.dispose();
+  // instanceMatrix no longer tracks the strands, so its bounds are stale
+  furMesh.frustumCulled = false;
+
+  furMesh.userData.updateStrands = function (skinnedMesh, dt, params = {}) {
+    getVertexSkinMatrix(skinnedMesh, 0, skinMatrix.value);
+    dtNode.value = dt;
+    stiffnessNode.value = params.stiffness ?? 36;
+    dampingNode.value = params.damping ?? 8;
+    gravityNode.value.copy(params.gravity || DEFAULT_GRAVITY);
+    renderer.compute(simulate);
+  };
+  return true;
+}
@@ -0,0 +1,356 @@
+
+// src/animals/bodyParts/FurGenerator.js
+import * as THREE from 'three';
+import { FurStrands } from './FurStrand.js';
+
+// Read-only; used when updateStrands is called without params.gravity
+export const DEFAULT_GRAVITY = new THREE.Vector3(0, -2.5, 0);
+
+// Five uniforms per strand: area sample, shuffle swap, two barycentric
+// uniforms and the length jitter
+const RANDOMS_PER_STRAND = 5;
+
+// Fills `out` with uniforms in [0, 1) from an xorshift32 stream. Each value
+// keeps 24 bits, exactly what a float32 can hold.
+function fillRandom(out, seed) {
+  let x = (seed >>> 0) || 0x9e3779b9;
+  for (let i = 0; i < out.length; ++i) {
+    x ^= x << 13;
+    x ^= x >>> 17;
+    x ^= x << 5;
+    out[i] = (x & 0xffffff) / 0x1000000;
+  }
+  return out;
+}
+
+// Strands are grouped into a CULL_GRID^3 grid of rest-pose cells for culling
+const CULL_GRID = 4;
+
+const _boneMatrix = new THREE.Matrix4();
+const _box = new THREE.Box3();
+const _v = new THREE.Vector3();
+const _frustum = new THREE.Frustum();
+const _projScreen = new THREE.Matrix4();
+const _cellMatrix = new THREE.Matrix4();
+const _sphere = new THREE.Sphere();
+const _batchMatrix = new THREE.Matrix4();
+
+// Unit-height strand cylinders, keyed by side count and thickness (to 1e-4).
+// Every fur mesh with the same shape shares one geometry, so callers must
+// not dispose it.
+const strandGeometries = new Map();
+
+function getStrandGeometry(sides, thickness) {
+  const q = Math.round(thickness * 10000);
+  const key = sides + '|' + q;
+  let geo = strandGeometries.get(key);
+  if (!geo) {
+    const radius = q / 10000;
+    geo = new THREE.CylinderGeometry(radius, radius * 0.5, 1.0, sides, 1, true);
+    geo.translate(0, 0.5, 0);
+    strandGeometries.set(key, geo);
+  }
+  return geo;
+}
+
+// Strand geometry already added to each shared BatchedMesh
+const batchGeometryIds = new WeakMap();
+
+function getBatchStrandGeometry(batch, strandGeo) {
+  let ids = batchGeometryIds.get(batch);
+  if (!ids) {
+    ids = new Map();
+    batchGeometryIds.set(batch, ids);
+  }
+  let id = ids.get(strandGeo);
+  if (id === undefined) {
+    id = batch.addGeometry(strandGeo);
+    ids.set(strandGeo, id);
+  }
+  return id;
+}
+
+// Folds the weighted bones that skin vertex `index` into one affine matrix,
+// so points skinned like that vertex need a single 4x3 transform each.
+// Equivalent to SkinnedMesh.applyBoneTransform(index, point) for any point.
+export function getVertexSkinMatrix(skinnedMesh, index, target) {
+  const { skeleton, geometry } = skinnedMesh;
+  const skinIndex = geometry.attributes.skinIndex;
+  const skinWeight = geometry.attributes.skinWeight;
+  const te = target.elements;
+  te.fill(0);
+  for (let j = 0; j < 4; j++) {
+    const weight = skinWeight.getComponent(index, j);
+    if (weight === 0) continue;
+    const bone = skinIndex.getComponent(index, j);
+    const be = _boneMatrix.multiplyMatrices(skeleton.bones[bone].matrixWorld, skeleton.boneInverses[bone]).elements;
+    for (let e = 0; e < 16; e++) te[e] += be[e] * weight;
+  }
+  // Weights blend the affine part only; the bottom row stays (0, 0, 0, 1)
+  te[15] = 1;
+  return target.premultiply(skinnedMesh.bindMatrixInverse).multiply(skinnedMesh.bindMatrix);
+}
+
+// Sorts strands so each grid cell of rest roots is a contiguous run, and
+// returns the non-empty cells as { start, end, sphere, hidden }. `reach` pads
+// the rest-pose bounding sphere to cover the strands themselves.
+function buildStrandCells(strands, reach) {
+  const { count, restRoot } = strands;
+  _box.setFromArray(restRoot);
+  const min = _box.min, size = _box.getSize(_v);
+  const cellIndex = (value, lo, extent) =>
+    Math.min(CULL_GRID - 1, Math.floor((value - lo) / (extent || 1) * CULL_GRID));
+
+  const cellOf = new Uint16Array(count);
+  const starts = new Uint32Array(CULL_GRID * CULL_GRID * CULL_GRID + 1);
+  for (let i = 0, k = 0; i < count; ++i, k += 3) {
+    const c = cellIndex(restRoot[k], min.x, size.x) +
+      CULL_GRID * (cellIndex(restRoot[k + 1], min.y, size.y) +
+      CULL_GRID * cellIndex(restRoot[k + 2], min.z, size.z));
+    cellOf[i] = c;
+    starts[c + 1]++;
+  }
+  for (let c = 1; c < starts.length; ++c) starts[c] += starts[c - 1];
+
+  // Stable counting sort, so strands keep their shuffled order within a cell
+  const next = starts.slice();
+  const order = new Uint32Array(count);
+  for (let i = 0; i < count; ++i) order[next[cellOf[i]]++] = i;
+  strands.reorder(order);
+
+  const cells = [];
+  for (let c = 0; c < starts.length - 1; ++c) {
+    const start = starts[c], end = starts[c + 1];
+    if (start === end) continue;
+    _box.makeEmpty();
+    for (let i = start; i < end; ++i) _box.expandByPoint(_v.fromArray(strands.restRoot, i * 3));
+    const sphere = _box.getBoundingSphere(new THREE.Sphere());
+    sphere.radius += reach;
+    cells.push({ start, end, sphere, hidden: false });
+  }
+  return cells;
+}
+
+// Returns an InstancedMesh of strands. With options.batch (a BatchedMesh
+// shared between animals) the strands are added to that batch instead, and
+// the result is a handle { isFurBatch, batch, instanceIds, matrixWorld,
+// userData } exposing the same userData.strands / userData.updateStrands.
+export function generateFurMesh(skinnedMesh, options = {}) {
+  const geometry = skinnedMesh.geometry;
+  const strandCount = options.strandCount || 1200;
+  const strandLength = options.strandLength || 0.11;
+  const lengthJitter = options.lengthJitter || 0.04;
+  const color = options.color || 0x332210;
+  const thickness = options.thickness || 0.012;
+  // Fewer sides (e.g. 3) suit animals seen from a distance
+  const sides = options.sides || 5;
+  // Same seed, same mesh and options: same fur
+  const seed = options.seed ?? Math.random() * 0x100000000;
+
+  const strandGeo = getStrandGeometry(sides, thickness);
+
+  const batch = options.batch || null;
+  let furMesh;
+  if (batch) {
+    // The batch brings its own material; matrices are written via setMatrixAt
+    furMesh = {
+      isFurBatch: true,
+      batch,
+      instanceIds: new Int32Array(strandCount),
+      matrixWorld: batch.matrixWorld,
+      userData: {},
+    };
+  } else {
+    const furMat = new THREE.MeshStandardMaterial({
+      color,
+      roughness: 0.6,
+      metalness: 0.1,
+      side: THREE.DoubleSide,
+      transparent: true,
+      opacity: 0.97,
+      flatShading: true,
+    });
+
+    furMesh = new THREE.InstancedMesh(strandGeo, furMat, strandCount);
+    furMesh.castShadow = true;
+    furMesh.receiveShadow = false;
+    // Rewritten every frame, usually only in part
+    furMesh.instanceMatrix.setUsage(THREE.DynamicDrawUsage);
+  }
+  const strands = new FurStrands(strandCount);
+
+  const posAttr = geometry.attributes.position;
+  const normAttr = geometry.attributes.normal;
+  const idxAttr = geometry.index;
+  const triCount = idxAttr ? idxAttr.count / 3 : posAttr.count / 3;
+  // Read straight from the flat xyz arrays rather than through Vector3s
+  const pa = posAttr.array;
+  const na = normAttr.array;
+  const idx = idxAttr ? idxAttr.array : null;
+
+  // Running sum of triangle areas; strands pick a triangle by sampling it
+  const cdf = new Float64Array(triCount);
+  let totalArea = 0;
+  for (let i = 0; i < triCount; ++i) {
+    const ia = (idx ? idx[i * 3] : i * 3) * 3;
+    const ib = (idx ? idx[i * 3 + 1] : i * 3 + 1) * 3;
+    const ic = (idx ? idx[i * 3 + 2] : i * 3 + 2) * 3;
+    const ax = pa[ia], ay = pa[ia + 1], az = pa[ia + 2];
+    const abx = pa[ib] - ax, aby = pa[ib + 1] - ay, abz = pa[ib + 2] - az;
+    const acx = pa[ic] - ax, acy = pa[ic + 1] - ay, acz = pa[ic + 2] - az;
+    const cx = aby * acz - abz * acy;
+    const cy = abz * acx - abx * acz;
+    const cz = abx * acy - aby * acx;
+    const area = Math.sqrt(cx * cx + cy * cy + cz * cz) * 0.5;
+    totalArea += area;
+    cdf[i] = totalArea;
+  }
+
+  const random = fillRandom(new Float32Array(strandCount * RANDOMS_PER_STRAND), seed);
+  let ri = 0;
+
+  // Pick every strand's triangle in one sweep: sort the area samples, walk
+  // the CDF alongside them, then shuffle so strand order stays random.
+  const samples = new Float64Array(strandCount);
+  for (let i = 0; i < strandCount; ++i) samples[i] = random[ri++] * totalArea;
+  samples.sort();
+  const triIdx = new Int32Array(strandCount);
+  for (let i = 0, t = 0; i < strandCount; ++i) {
+    while (t < triCount - 1 && cdf[t] < samples[i]) ++t;
+    triIdx[i] = t;
+  }
+  for (let i = strandCount - 1; i > 0; --i) {
+    const j = Math.floor(random[ri++] * (i + 1));
+    const tmp = triIdx[i];
+    triIdx[i] = triIdx[j];
+    triIdx[j] = tmp;
+  }
+
+  for (let i = 0; i < strandCount; ++i) {
+    const tri = triIdx[i];
+    const ia = (idx ? idx[tri * 3] : tri * 3) * 3;
+    const ib = (idx ? idx[tri * 3 + 1] : tri * 3 + 1) * 3;
+    const ic = (idx ? idx[tri * 3 + 2] : tri * 3 + 2) * 3;
+
+    // Uniform barycentric weights from two uniforms (Turk's sqrt mapping)
+    const su1 = Math.sqrt(random[ri++]);
+    const q2 = random[ri++];
+    const u = 1 - su1;
+    const v = q2 * su1;
+    const w = su1 * (1 - q2);
+
+    const len = strandLength + (random[ri++] - 0.5) * lengthJitter;
+    // The interpolated normal is normalized by strands.set
+    strands.set(
+      i,
+      pa[ia] * u + pa[ib] * v + pa[ic] * w,
+      pa[ia + 1] * u + pa[ib + 1] * v + pa[ic + 1] * w,
+      pa[ia + 2] * u + pa[ib + 2] * v + pa[ic + 2] * w,
+      na[ia] * u + na[ib] * v + na[ic] * w,
+      na[ia + 1] * u + na[ib + 1] * v + na[ic + 1] * w,
+      na[ia + 2] * u + na[ib + 2] * v + na[ic + 2] * w,
+      len
+    );
+  }
+
+  const cells = buildStrandCells(strands, strandLength + lengthJitter * 0.5);
+  furMesh.userData.strands = strands;
+
+  let batchMatrices = null;
+  if (batch) {
+    const geometryId = getBatchStrandGeometry(batch, strandGeo);
+    for (let i = 0; i < strandCount; ++i) furMesh.instanceIds[i] = batch.addInstance(geometryId);
+    // Staging for the column-major matrices handed to batch.setMatrixAt
+    batchMatrices = new Float32Array(strandCount * 16);
+  }
+
+  const _skinMatrix = new THREE.Matrix4();
+  // With params.camera set, cells whose bounds are outside its frustum are
+  // neither simulated nor redrawn; their strands are collapsed to a point
+  // (hidden, for a batch).
+  furMesh.userData.updateStrands = function (skinnedMesh, dt, params = {}) {
+    const gravity = params.gravity || DEFAULT_GRAVITY;
+    const stiffness = params.stiffness ?? 36;
+    const damping = params.damping ?? 8;
+    const camera = params.camera;
+    const { root, tip } = strands;
+    // instanceMatrix (4x4 column-major), after enableFurAffineRows the 3x4
+    // row-major rows buffer, or for a batch the staging matrices
+    const rows = furMesh.userData.instanceRows;
+    const instanceData = batch ? null : rows || furMesh.instanceMatrix;
+    const te = batch ? batchMatrices : instanceData.array;
+    const stride = rows ? 12 : 16;
+    // First and last strand whose matrix was written; only that slice is uploaded
+    let first = -1, last = -1;
+    // Strand roots follow the bones of vertex 0, blended once per update
+    const m = getVertexSkinMatrix(skinnedMesh, 0, _skinMatrix).elements;
+    if (camera) {
+      _projScreen.multiplyMatrices(camera.projectionMatrix, camera.matrixWorldInverse);
+      _frustum.setFromProjectionMatrix(_projScreen);
+      _cellMatrix.multiplyMatrices(furMesh.matrixWorld, _skinMatrix);
+    }
+    for (const cell of cells) {
+      if (camera && !_frustum.intersectsSphere(_sphere.copy(cell.sphere).applyMatrix4(_cellMatrix))) {
+        if (!cell.hidden) {
+          if (batch) {
+            for (let i = cell.start; i < cell.end; ++i) batch.setVisibleAt(furMesh.instanceIds[i], false);
+          } else {
+            te.fill(0, cell.start * stride, cell.end * stride);
+          }
+          cell.hidden = true;
+          if (first < 0) first = cell.start;
+          last = cell.end - 1;
+        }
+        continue;
+      }
+      if (cell.hidden && batch) {
+        for (let i = cell.start; i < cell.end; ++i) batch.setVisibleAt(furMesh.instanceIds[i], true);
+      }
+      cell.hidden = false;
+      strands.update(cell.start, cell.end, m, dt, stiffness, damping, gravity.x, gravity.y, gravity.z);
+      for (let i = cell.start, k = i * 3; i < cell.end; ++i, k += 3) {
+        // Instance matrix: translate to the root, rotate +Y onto the strand
+        // and stretch Y to its length. This is Quaternion.setFromUnitVectors
+        // with from = +Y (so q.y = 0) followed by Matrix4.compose with scale
+        // (1, len, 1), written straight into the instance buffer.
+        let dx = tip[k] - root[k], dy = tip[k + 1] - root[k + 1], dz = tip[k + 2] - root[k + 2];
+        const len = Math.sqrt(dx * dx + dy * dy + dz * dz);
+        const invLen = 1 / (len || 1);
+        dx *= invLen; dy *= invLen; dz *= invLen;
+        let qx, qz, qw;
+        const r = dy + 1;
+        if (r < Number.EPSILON) {
+          // Pointing straight down: half turn about Z
+          qx = 0; qz = 1; qw = 0;
+        } else {
+          const s = 1 / Math.sqrt(dz * dz + dx * dx + r * r);
+          qx = dz * s; qz = -dx * s; qw = r * s;
+        }
+        const x2 = qx + qx, z2 = qz + qz;
+        const xx = qx * x2, xz = qx * z2, zz = qz * z2;
+        const wx = qw * x2, wz = qw * z2;
+        const o = i * stride;
+        if (rows) {
+          te[o] = 1 - zz; te[o + 1] = -wz * len; te[o + 2] = xz; te[o + 3] = root[k];
+          te[o + 4] = wz; te[o + 5] = (1 - (xx + zz)) * len; te[o + 6] = -wx; te[o + 7] = root[k + 1];
+          te[o + 8] = xz; te[o + 9] = wx * len; te[o + 10] = 1 - xx; te[o + 11] = root[k + 2];
+        } else {
+          te[o] = 1 - zz; te[o + 1] = wz; te[o + 2] = xz; te[o + 3] = 0;
+          te[o + 4] = -wz * len; te[o + 5] = (1 - (xx + zz)) * len; te[o + 6] = wx * len; te[o + 7] = 0;
+          te[o + 8] = xz; te[o + 9] = -wx; te[o + 10] = 1 - xx; te[o + 11] = 0;
+          te[o + 12] = root[k]; te[o + 13] = root[k + 1]; te[o + 14] = root[k + 2]; te[o + 15] = 1;
+          if (batch) batch.setMatrixAt(furMesh.instanceIds[i], _batchMatrix.fromArray(te, o));
+        }
+        if (first < 0) first = i;
+        last = i;
+      }
+    }
+    if (instanceData && first >= 0) {
+      instanceData.clearUpdateRanges();
+      instanceData.addUpdateRange(first * stride, (last - first + 1) * stride);
+      instanceData.needsUpdate = true;
+    }
+  };
+
+  return furMesh;
+}
@@ -0,0 +1,395 @@
+
+import * as THREE from 'three';
+
+const TAU = Math.PI * 2;
+const _defaultUp = new THREE.Vector3(0, 1, 0);
+const _tangent = new THREE.Vector3();
+const _bitangent = new THREE.Vector3();
+
+// The elephant only ever uses a handful of fixed side counts, so the unit
+// circle for each is computed once and reused by every ring.
+const _trigCache = new Map();
+
+function ringTrig(sides) {
+  let trig = _trigCache.get(sides);
+  if (trig) return trig;
+  const cos = new Float32Array(sides);
+  const sin = new Float32Array(sides);
+  for (let i = 0; i < sides; i++) {
+    const theta = (i / sides) * TAU;
+    cos[i] = Math.cos(theta);
+    sin[i] = Math.sin(theta);
+  }
+  trig = [cos, sin];
+  _trigCache.set(sides, trig);
+  return trig;
+}
+
+// Bone name -> index lookups, built once per skeleton and shared by every
+// generator; rebuilt only if the skeleton's bone count changes.
+const _boneIndexMaps = new WeakMap();
+
+/**
+ * Returns a lookup from bone name to its index in skeleton.bones.
+ * @param {THREE.Skeleton} skeleton - Skeleton to index.
+ * @returns {Object<string, number>} Shared map; treat it as read-only.
+ */
+export function getBoneIndexMap(skeleton) {
+  let entry = _boneIndexMaps.get(skeleton);
+  if (!entry || entry.count !== skeleton.bones.length) {
+    const map = Object.create(null);
+    skeleton.bones.forEach((bone, idx) => { map[bone.name] = idx; });
+    entry = { map, count: skeleton.bones.length };
+    _boneIndexMaps.set(skeleton, entry);
+  }
+  return entry.map;
+}
+
+/**
+ * Creates a ring of vertices around a center point, oriented along an axis.
+ * @param {THREE.Vector3} center - Center of the ring.
+ * @param {THREE.Vector3} axis - Direction the ring faces (normal to the plane).
+ * @param {number} radius - Radius of the ring.
+ * @param {number} sides - Number of segments.
+ * @param {THREE.Vector3} [up] - Optional up vector to stabilize rotation.
+ * @param {Float32Array} [out] - Buffer to write into, reused across rings.
+ * @returns {Float32Array} Flat xyz vertex positions, sides * 3 floats.
+ */
+export function createRing(center, axis, radius, sides, up = _defaultUp, out = new Float32Array(sides * 3)) {
+  // Orthonormal basis
+  _tangent.crossVectors(axis, up).normalize();
+  // If axis and up are parallel, fallback to X
+  if (_tangent.lengthSq() < 1e-6) _tangent.set(1, 0, 0);
+  _bitangent.crossVectors(axis, _tangent).normalize();
+
+  const tx = _tangent.x, ty = _tangent.y, tz = _tangent.z;
+  const bx = _bitangent.x, by = _bitangent.y, bz = _bitangent.z;
+  const cx = center.x, cy = center.y, cz = center.z;
+
+  const [cos, sin] = ringTrig(sides);
+  for (let i = 0, k = 0; i < sides; i++, k += 3) {
+    const c = cos[i] * radius;
+    const s = sin[i] * radius;
+    out[k] = tx * c + bx * s + cx;
+    out[k + 1] = ty * c + by * s + cy;
+    out[k + 2] = tz * c + bz * s + cz;
+  }
+  return out;
+}
+
+function writeQuad(indices, offset, a, b, c, d) {
+  // Two triangles per quad
+  indices[offset] = a;
+  indices[offset + 1] = c;
+  indices[offset + 2] = b;
+  indices[offset + 3] = b;
+  indices[offset + 4] = c;
+  indices[offset + 5] = d;
+  return offset + 6;
+}
+
+/**
+ * Writes triangle indices bridging two rings of vertices.
+ * @param {number} ringA - Start index of the first ring.
+ * @param {number} ringB - Start index of the second ring.
+ * @param {number} sides - Number of segments in the rings.
+ * @param {Uint32Array} indices - Preallocated index buffer to write into.
+ * @param {number} offset - Position in indices to start writing at.
+ * @returns {number} Position just past the 6 * sides indices written.
+ */
+export function bridgeRings(ringA, ringB, sides, indices, offset) {
+  const last = sides - 1;
+  for (let j = 0; j < last; j++) {
+    offset = writeQuad(indices, offset, ringA + j, ringA + j + 1, ringB + j, ringB + j + 1);
+  }
+  // The wrap-around quad closes the ring back onto its first vertex.
+  return writeQuad(indices, offset, ringA + last, ringA, ringB + last, ringB);
+}
+
+/**
+ * Writes a triangle fan closing a ring of vertices onto a single apex.
+ * @param {number} ring - Start index of the ring.
+ * @param {number} apex - Index of the apex vertex.
+ * @param {number} sides - Number of segments in the ring.
+ * @param {Uint32Array} indices - Preallocated index buffer to write into.
+ * @param {number} offset - Position in indices to start writing at.
+ * @returns {number} Position just past the 3 * sides indices written.
+ */
+export function fanRing(ring, apex, sides, indices, offset) {
+  const last = sides - 1;
+  for (let j = 0; j < last; j++) {
+    indices[offset] = apex;
+    indices[offset + 1] = ring + j;
+    indices[offset + 2] = ring + j + 1;
+    offset += 3;
+  }
+  indices[offset] = apex;
+  indices[offset + 1] = ring + last;
+  indices[offset + 2] = ring;
+  return offset + 3;
+}
+
+/**
+ * Closes the end of a tube: bridges `segments` consecutive rings starting at
+ * `ring`, then fans the last of them onto the apex.
+ * @param {number} ring - Start index of the first (rim) ring.
+ * @param {number} segments - Number of bands between the rim and last ring.
+ * @param {number} apex - Index of the apex vertex.
+ * @param {number} sides - Number of segments in each ring.
+ * @param {Uint32Array} indices - Preallocated index buffer to write into.
+ * @param {number} offset - Position in indices to start writing at.
+ * @returns {number} Position just past the (2 * segments + 1) * 3 * sides
+ *   indices written.
+ */
+export function capRings(ring, segments, apex, sides, indices, offset) {
+  // One pass over the bands and the fan; the wrap-around quad and triangle
+  // of each ring are peeled out of the loops rather than using % sides.
+  const last = sides - 1;
+  let a = ring;
+  for (let seg = 0; seg < segments; seg++, a += sides) {
+    const b = a + sides;
+    for (let j = 0; j < last; j++) {
+      offset = writeQuad(indices, offset, a + j, a + j + 1, b + j, b + j + 1);
+    }
+    offset = writeQuad(indices, offset, a + last, a, b + last, b);
+  }
+  for (let j = 0; j < last; j++, offset += 3) {
+    indices[offset] = apex;
+    indices[offset + 1] = a + j;
+    indices[offset + 2] = a + j + 1;
+  }
+  indices[offset] = apex;
+  indices[offset + 1] = a + last;
+  indices[offset + 2] = a;
+  return offset + 3;
+}
+
+// Typed arrays of the right kind are adopted as-is; plain arrays are copied.
+function toAttribute(array, TypedArray, itemSize) {
+  return array instanceof TypedArray
+    ? new THREE.BufferAttribute(array, itemSize)
+    : new THREE.BufferAttribute(new TypedArray(array), itemSize);
+}
+
+/**
+ * Helper to build a BufferGeometry from standard arrays.
+ */
+export function buildBufferGeometry({ positions, normals, skinIndices, skinWeights, uvs, indices }) {
+  const geometry = new THREE.BufferGeometry();
+  if (positions && positions.length > 0) geometry.setAttribute('position', toAttribute(positions, Float32Array, 3));
+  if (normals && normals.length > 0) geometry.setAttribute('normal', toAttribute(normals, Float32Array, 3));
+  // Bone indices are stored as bytes; the skeletons built here stay well under 256 bones.
+  if (skinIndices && skinIndices.length > 0) geometry.setAttribute('skinIndex', toAttribute(skinIndices, Uint8Array, 4));
+  if (skinWeights && skinWeights.length > 0) geometry.setAttribute('skinWeight', toAttribute(skinWeights, Float32Array, 4));
+  if (uvs && uvs.length > 0) geometry.setAttribute('uv', toAttribute(uvs, Float32Array, 2));
+  if (indices && indices.length > 0) {
+    geometry.setIndex(ArrayBuffer.isView(indices) ? new THREE.BufferAttribute(indices, 1) : indices);
+  }
+  
+  geometry.computeBoundingBox();
+  geometry.computeBoundingSphere();
+  return geometry;
+}
+
+// Optional WebAssembly SIMD kernel for flat normals (assets/flat_normals).
+// Until initFlatNormals() has loaded it, or if it is missing, the scalar
+// loop in buildFlatFromIndexed is used.
+let _flatNormalsWasm = null;
+let _flatNormalsLoad = null;
+
+/**
+ * Loads the flat-normals wasm kernel. Safe to call more than once: later
+ * calls share the first load. A build that does not ship the binary (a 404)
+ * quietly keeps the scalar path; other failures are logged.
+ * @param {string|URL} [url] - Location of flat_normals.wasm.
+ * @returns {Promise<object|null>} The module exports, or null.
+ */
+export function initFlatNormals(url = new URL('../../libs/flat_normals.wasm', import.meta.url)) {
+  if (!_flatNormalsLoad) _flatNormalsLoad = loadFlatNormals(url);
+  return _flatNormalsLoad;
+}
+
+async function loadFlatNormals(url) {
+  try {
+    const response = await fetch(url);
+    if (response.status === 404) return null;
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    const { instance } = await WebAssembly.instantiate(await response.arrayBuffer());
+    _flatNormalsWasm = instance.exports;
+  } catch (err) {
+    console.warn('flat_normals.wasm unavailable, using scalar flat normals:', err);
+  }
+  return _flatNormalsWasm;
+}
+
+function flatNormalsWasm(wasm, positions) {
+  // One float of padding: the kernel moves every vertex as a 4-lane vector.
+  const size = positions.length + 1;
+  const posPtr = wasm.alloc_f32(size);
+  const nrmPtr = wasm.alloc_f32(size);
+  // Views are taken after both allocations, which may grow (and detach) memory.
+  new Float32Array(wasm.memory.buffer, posPtr, positions.length).set(positions);
+  wasm.flat_normals(posPtr, positions.length / 9, nrmPtr);
+  const normals = new Float32Array(wasm.memory.buffer, nrmPtr, positions.length).slice();
+  wasm.free_f32(posPtr, size);
+  wasm.free_f32(nrmPtr, size);
+  return normals;
+}
+
+/**
+ * Expands triangles into a flat-shaded soup in a single pass: each face
+ * normal is computed once and written to its three corners alongside the
+ * expanded positions.
+ * @param {ArrayLike<number>} positions - Flat xyz vertex positions.
+ * @param {ArrayLike<number>|null} indices - Triangle indices, or null when
+ *   positions are already one vertex per triangle corner. A soup's
+ *   positions are returned as-is rather than copied.
+ * @returns {{positions: Float32Array, normals: Float32Array}}
+ */
+export function buildFlatFromIndexed(positions, indices) {
+  if (_flatNormalsWasm) {
+    let soup = positions;
+    if (indices) {
+      soup = new Float32Array(indices.length * 3);
+      for (let k = 0, o = 0; k < indices.length; k++, o += 3) {
+        const i = indices[k] * 3;
+        soup[o] = positions[i];
+        soup[o + 1] = positions[i + 1];
+        soup[o + 2] = positions[i + 2];
+      }
+    }
+    return { positions: soup, normals: flatNormalsWasm(_flatNormalsWasm, soup) };
+  }
+
+  const cornerCount = indices ? indices.length : positions.length / 3;
+  const outPos = indices ? new Float32Array(cornerCount * 3) : positions;
+  const outNrm = new Float32Array(cornerCount * 3);
+
+  for (let k = 0; k < cornerCount; k += 3) {
+    const i0 = (indices ? indices[k] : k) * 3;
+    const i1 = (indices ? indices[k + 1] : k + 1) * 3;
+    const i2 = (indices ? indices[k + 2] : k + 2) * 3;
+    const ax = positions[i0], ay = positions[i0 + 1], az = positions[i0 + 2];
+    const bx = positions[i1], by = positions[i1 + 1], bz = positions[i1 + 2];
+    const cx = positions[i2], cy = positions[i2 + 1], cz = positions[i2 + 2];
+
+    const ex = bx - ax, ey = by - ay, ez = bz - az;
+    const fx = cx - ax, fy = cy - ay, fz = cz - az;
+    let nx = ey * fz - ez * fy;
+    let ny = ez * fx - ex * fz;
+    let nz = ex * fy - ey * fx;
+    const invLen = 1 / (Math.hypot(nx, ny, nz) || 1);
+    nx *= invLen; ny *= invLen; nz *= invLen;
+
+    const o = k * 3;
+    if (indices) {
+      outPos[o] = ax; outPos[o + 1] = ay; outPos[o + 2] = az;
+      outPos[o + 3] = bx; outPos[o + 4] = by; outPos[o + 5] = bz;
+      outPos[o + 6] = cx; outPos[o + 7] = cy; outPos[o + 8] = cz;
+    }
+    outNrm[o] = nx; outNrm[o + 1] = ny; outNrm[o + 2] = nz;
+    outNrm[o + 3] = nx; outNrm[o + 4] = ny; outNrm[o + 5] = nz;
+    outNrm[o + 6] = nx; outNrm[o + 7] = ny; outNrm[o + 8] = nz;
+  }
+  return { positions: outPos, normals: outNrm };
+}
+
+/**
+ * Gathers an indexed attribute into one element per index.
+ * @param {THREE.BufferAttribute} attribute - Attribute to expand.
+ * @param {ArrayLike<number>} indices - Triangle indices.
+ * @returns {THREE.BufferAttribute}
+ */
+export function expandAttribute(attribute, indices) {
+  const { array, itemSize, normalized } = attribute;
+  const out = new array.constructor(indices.length * itemSize);
+  for (let i = 0, o = 0; i < indices.length; i++) {
+    const src = indices[i] * itemSize;
+    for (let c = 0; c < itemSize; c++) out[o++] = array[src + c];
+  }
+  return new THREE.BufferAttribute(out, itemSize, normalized);
+}
+
+/**
+ * Concatenates non-indexed parts that share the same attributes into one
+ * geometry. Each output array is sized up front from the parts' lengths and
+ * filled with one TypedArray.set() per part. Throws if there are no parts,
+ * if a part is indexed, or if the parts' attribute sets or layouts differ.
+ * @param {THREE.BufferGeometry[]} parts - Non-indexed geometries to merge.
+ * @returns {THREE.BufferGeometry}
+ */
+export function mergeFlatParts(parts) {
+  if (parts.length === 0) throw new Error('mergeFlatParts: no parts to merge');
+  const names = Object.keys(parts[0].attributes);
+  for (const part of parts) {
+    if (part.index) throw new Error('mergeFlatParts: parts must be non-indexed');
+    for (const name of Object.keys(part.attributes)) {
+      if (!names.includes(name)) {
+        throw new Error(`mergeFlatParts: the "${name}" attribute is not on every part`);
+      }
+    }
+  }
+
+  const geometry = new THREE.BufferGeometry();
+  for (const name of names) {
+    const { array, itemSize, normalized } = parts[0].attributes[name];
+
+    let length = 0;
+    for (const part of parts) {
+      const attribute = part.attributes[name];
+      if (!attribute) throw new Error(`mergeFlatParts: a part is missing the "${name}" attribute`);
+      if (attribute.itemSize !== itemSize || attribute.array.constructor !== array.constructor) {
+        throw new Error(`mergeFlatParts: the "${name}" attribute layout differs between parts`);
+      }
+      length += attribute.array.length;
+    }
+
+    const out = new array.constructor(length);
+    let offset = 0;
+    for (const part of parts) {
+      const src = part.attributes[name].array;
+      out.set(src, offset);
+      offset += src.length;
+    }
+    geometry.setAttribute(name, new THREE.BufferAttribute(out, itemSize, normalized));
+  }
+  return geometry;
+}
+
+/**
+ * Reflects a non-indexed geometry across the x = 0 plane. Positions and
+ * normals have x negated, the last two corners of every triangle are swapped
+ * so the winding stays front-facing, and skin indices are rewritten through
+ * boneRemap (bones not in the map are kept as they are).
+ * @param {THREE.BufferGeometry} geometry - Non-indexed geometry to mirror.
+ * @param {Map<number, number>} [boneRemap] - Bone index substitutions.
+ * @returns {THREE.BufferGeometry} A new geometry; the input is untouched.
+ */
+export function mirrorGeometryX(geometry, boneRemap = new Map()) {
+  const mirrored = new THREE.BufferGeometry();
+  for (const name of Object.keys(geometry.attributes)) {
+    const { array, itemSize, normalized } = geometry.attributes[name];
+    const out = new array.constructor(array);
+
+    const stride = itemSize * 3;
+    for (let t = 0; t < out.length; t += stride) {
+      const b = t + itemSize;
+      const c = b + itemSize;
+      for (let k = 0; k < itemSize; k++) {
+        out[b + k] = array[c + k];
+        out[c + k] = array[b + k];
+      }
+    }
+
+    if (name === 'position' || name === 'normal') {
+      for (let i = 0; i < out.length; i += 3) out[i] = -out[i];
+    } else if (name === 'skinIndex') {
+      for (let i = 0; i < out.length; i++) {
+        const bone = boneRemap.get(out[i]);
+        if (bone !== undefined) out[i] = bone;
+      }
+    }
+    mirrored.setAttribute(name, new THREE.BufferAttribute(out, itemSize, normalized));
+  }
+  return mirrored;
+}
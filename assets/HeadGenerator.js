@@ -0,0 +1,84 @@
+// src/animals/bodyParts/HeadGenerator.js
+import * as THREE from 'three';
+import { buildBufferGeometry, getBoneIndexMap } from '../../utils/GeometryBuilder.js';
+
+// Unit icosahedra by detail level. PolyhedronGeometry is built as a
+// non-indexed triangle soup, so these arrays are ready to transform as-is.
+const _unitIcosahedra = new Map();
+const _matrix = new THREE.Matrix4();
+const _normalMatrix = new THREE.Matrix3();
+const _scale = new THREE.Vector3();
+const _forward = new THREE.Vector3(0, 0, 1);
+
+function unitIcosahedron(detail) {
+  let ico = _unitIcosahedra.get(detail);
+  if (!ico) {
+    const geo = new THREE.IcosahedronGeometry(1.0, detail);
+    ico = {
+      positions: geo.attributes.position.array,
+      normals: geo.attributes.normal.array,
+      uvs: geo.attributes.uv.array
+    };
+    _unitIcosahedra.set(detail, ico);
+  }
+  return ico;
+}
+
+export function generateHeadGeometry(skeleton, options = {}) {
+  const boneIndexMap = getBoneIndexMap(skeleton);
+  const neckBone = skeleton.bones[boneIndexMap['spine_neck']];
+  const headBone = skeleton.bones[boneIndexMap['head']];
+  if (!neckBone || !headBone) throw new Error('Missing spine_neck or head bone!');
+
+  const neckPos = new THREE.Vector3().setFromMatrixPosition(neckBone.matrixWorld);
+  const headPos = new THREE.Vector3().setFromMatrixPosition(headBone.matrixWorld);
+
+  const mid = neckPos.clone().lerp(headPos, 0.5);
+  const dir = headPos.clone().sub(neckPos).normalize();
+  const length = neckPos.distanceTo(headPos);
+
+  const baseRadius = options.radius || 0.13;
+  const detail = options.detail !== undefined ? options.detail : 0; 
+  const ico = unitIcosahedron(detail);
+
+  // Scale, orient along the neck-to-head direction and centre between them,
+  // all in one matrix applied in a single pass.
+  const quat = new THREE.Quaternion().setFromUnitVectors(_forward, dir);
+  _matrix.compose(mid, quat, _scale.set(1.2 * baseRadius, 1.0 * baseRadius, length / 2));
+  _normalMatrix.getNormalMatrix(_matrix);
+  const m = _matrix.elements;
+  const n = _normalMatrix.elements;
+
+  const src = ico.positions;
+  const srcNormals = ico.normals;
+  const vcount = src.length / 3;
+  const positions = new Float32Array(vcount * 3);
+  const normals = new Float32Array(vcount * 3);
+  for (let i = 0; i < src.length; i += 3) {
+    const x = src[i], y = src[i + 1], z = src[i + 2];
+    positions[i] = m[0] * x + m[4] * y + m[8] * z + m[12];
+    positions[i + 1] = m[1] * x + m[5] * y + m[9] * z + m[13];
+    positions[i + 2] = m[2] * x + m[6] * y + m[10] * z + m[14];
+
+    const nx = srcNormals[i], ny = srcNormals[i + 1], nz = srcNormals[i + 2];
+    const tx = n[0] * nx + n[3] * ny + n[6] * nz;
+    const ty = n[1] * nx + n[4] * ny + n[7] * nz;
+    const tz = n[2] * nx + n[5] * ny + n[8] * nz;
+    const invLen = 1 / (Math.hypot(tx, ty, tz) || 1);
+    normals[i] = tx * invLen;
+    normals[i + 1] = ty * invLen;
+    normals[i + 2] = tz * invLen;
+  }
+
+  const skinIndices = new Uint8Array(vcount * 4);
+  const skinWeights = new Float32Array(vcount * 4);
+  const boneIdx = boneIndexMap['head'];
+  for (let i = 0; i < vcount; i++) {
+    skinIndices[i * 4] = boneIdx;
+    skinWeights[i * 4] = 1.0;
+  }
+
+  return buildBufferGeometry({
+    positions, normals, skinIndices, skinWeights, uvs: ico.uvs.slice()
+  });
+}
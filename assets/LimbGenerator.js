@@ -0,0 +1,162 @@
+
+// src/animals/bodyParts/LimbGenerator.js
+import * as THREE from 'three';
+import { createRing, bridgeRings, capRings, buildBufferGeometry, getBoneIndexMap } from '../../utils/GeometryBuilder.js';
+
+// Writes a cap of `segments` rings narrowing from the rim ring at `rimStart`
+// towards `apex`, plus the apex itself, through `writeVertex`. Returns the
+// apex vertex index.
+function buildBulgedEndCap({ positions, writeVertex, rimStart, apex, segments, sides, center, skinA, skinB, boneWeightFunc = t => [1 - t, t], uvBase = 0 }) {
+  for (let seg = 0; seg <= segments; seg++) {
+    const t = seg / segments;
+    const [wa, wb] = boneWeightFunc(t);
+    for (let j = 0; j < sides; j++) {
+      const r = (rimStart + j) * 3;
+      const rx = positions[r], ry = positions[r + 1], rz = positions[r + 2];
+      const dx = apex.x - rx, dy = apex.y - ry, dz = apex.z - rz;
+      let nx, ny, nz;
+      if (seg === 0) {
+        nx = rx - center.x; ny = ry - center.y; nz = rz - center.z;
+      } else {
+        nx = dx; ny = dy; nz = dz;
+      }
+      const invLen = 1 / (Math.sqrt(nx * nx + ny * ny + nz * nz) || 1);
+      writeVertex(
+        rx + dx * t, ry + dy * t, rz + dz * t,
+        nx * invLen, ny * invLen, nz * invLen,
+        j / sides, uvBase + t,
+        skinA, skinB, wa, wb
+      );
+    }
+  }
+  return writeVertex(apex.x, apex.y, apex.z, 0, 0, 1, 0.5, uvBase + 1, skinB, skinB, 1, 0);
+}
+
+// Bone world matrices are read as-is; the caller brings them up to date.
+export function generateLimbGeometry(skeleton, options = {}) {
+  const boneNames = options.bones || [
+    options.shoulderBone || 'front_left_collarbone',
+    options.upperBone || 'front_left_upper_leg',
+    options.lowerBone || 'front_left_lower_leg',
+    options.pawBone || 'front_left_paw'
+  ];
+  const sides = options.sides || 7;
+  const radii = options.radii || [0.075, 0.060, 0.050, 0.035];
+  const yOffset = options.yOffset || 0;
+
+  const boneIndexMap = getBoneIndexMap(skeleton);
+
+  // Each bone's world position is read once; callers must not mutate it.
+  const positionCache = new Map();
+  const getPos = name => {
+    let pos = positionCache.get(name);
+    if (pos) return pos;
+    const idx = boneIndexMap[name];
+    const bone = skeleton.bones[idx];
+    if (!bone) throw new Error(`Missing bone: ${name}`);
+    pos = new THREE.Vector3().setFromMatrixPosition(bone.matrixWorld);
+    positionCache.set(name, pos);
+    return pos;
+  };
+  const points = boneNames.map(getPos);
+
+  const capSegments = 2;
+  // Body rings, the shoulder cap (capSegments + 1 rings and an apex) and the
+  // two-ring foot cap with its apex
+  const vertexCount = points.length * sides + (sides * (capSegments + 1) + 1) + (sides * 2 + 1);
+  const positions = new Float32Array(vertexCount * 3);
+  const normals = new Float32Array(vertexCount * 3);
+  const skinIndices = new Uint8Array(vertexCount * 4);
+  const skinWeights = new Float32Array(vertexCount * 4);
+  const uvs = new Float32Array(vertexCount * 2);
+  let vertex = 0;
+  const writeVertex = (x, y, z, nx, ny, nz, u, v, boneA, boneB, wa, wb) => {
+    const p = vertex * 3, s = vertex * 4, t = vertex * 2;
+    positions[p] = x; positions[p + 1] = y; positions[p + 2] = z;
+    normals[p] = nx; normals[p + 1] = ny; normals[p + 2] = nz;
+    uvs[t] = u; uvs[t + 1] = v;
+    skinIndices[s] = boneA; skinIndices[s + 1] = boneB;
+    skinWeights[s] = wa; skinWeights[s + 1] = wb;
+    return vertex++;
+  };
+
+  // Body strips, the shoulder cap (capSegments strips and a fan) and the
+  // single-strip foot cap with its fan
+  const indices = new Uint32Array(((points.length - 1 + capSegments + 1) * 2 + 2) * sides * 3);
+  let indexOffset = 0;
+  const ringStarts = [];
+
+  const ringBuffer = new Float32Array(sides * 3);
+  for (let i = 0; i < points.length; i++) {
+    const center = points[i];
+    const axis = (i === points.length - 1)
+        ? center.clone().sub(points[i - 1]).normalize()
+        : points[i + 1].clone().sub(center).normalize();
+    const ring = createRing(center, axis, radii[i], sides, undefined, ringBuffer);
+    const mainBone = boneIndexMap[boneNames[i]];
+
+    ringStarts.push(vertex);
+
+    for (let j = 0, k = 0; j < sides; j++, k += 3) {
+      const x = ring[k], y = ring[k + 1], z = ring[k + 2];
+      const nx = x - center.x, ny = y - center.y, nz = z - center.z;
+      const invLen = 1 / (Math.hypot(nx, ny, nz) || 1);
+      writeVertex(
+        x, y + yOffset, z,
+        nx * invLen, ny * invLen, nz * invLen,
+        j / sides, i / (points.length - 1),
+        mainBone, mainBone, 1, 0
+      );
+    }
+  }
+
+  for (let seg = 0; seg < points.length - 1; seg++) {
+    indexOffset = bridgeRings(ringStarts[seg], ringStarts[seg + 1], sides, indices, indexOffset);
+  }
+
+  // Cap vertices are appended after the body, starting from a copy of its
+  // first ring.
+  const parentBone = getPos(options.parentBone || boneNames[0]);
+  const shoulderApex = parentBone.clone().lerp(points[0], -0.25);
+  const baseIdx = vertex;
+  const shoulderApexIdx = buildBulgedEndCap({
+    positions,
+    writeVertex,
+    rimStart: ringStarts[0],
+    apex: shoulderApex,
+    segments: capSegments,
+    sides,
+    center: points[0],
+    skinA: boneIndexMap[boneNames[0]],
+    skinB: boneIndexMap[boneNames[1]],
+    boneWeightFunc: t => [1 - t, t],
+    uvBase: -0.35
+  });
+
+  indexOffset = capRings(baseIdx, capSegments, shoulderApexIdx, sides, indices, indexOffset);
+
+  const tipApex = points[points.length - 1].clone().add(
+    points[points.length - 1].clone().sub(points[points.length - 2]).normalize().multiplyScalar(-0.015)
+  );
+  const tipBaseIdx = vertex;
+  const tipApexIdx = buildBulgedEndCap({
+    positions,
+    writeVertex,
+    rimStart: ringStarts[ringStarts.length - 1],
+    apex: tipApex,
+    segments: 1,
+    sides,
+    center: points[points.length - 1],
+    skinA: boneIndexMap[boneNames[boneNames.length - 1]],
+    skinB: boneIndexMap[boneNames[boneNames.length - 1]],
+    boneWeightFunc: t => [1, 0],
+    uvBase: 1.05
+  });
+
+  indexOffset = capRings(tipBaseIdx, 1, tipApexIdx, sides, indices, indexOffset);
+
+  const geometry = buildBufferGeometry({
+    positions, normals, skinIndices, skinWeights, uvs, indices
+  });
+  return geometry;
+}
@@ -0,0 +1,126 @@
+
+// src/animals/bodyParts/NeckGenerator.js
+import * as THREE from 'three';
+import { createRing, bridgeRings, capRings, buildBufferGeometry, getBoneIndexMap } from '../../utils/GeometryBuilder.js';
+
+// Bone world matrices are read as-is; the caller brings them up to date.
+export function generateNeckGeometry(skeleton, options = {}) {
+  const sides = options.sides || 8;
+  const yOffset = options.yOffset || 0;
+  const neckChain = ['spine_mid', 'spine_neck'];
+
+  const boneIndexMap = getBoneIndexMap(skeleton);
+
+  // Each bone's world position is read once; callers must not mutate it.
+  const positionCache = new Map();
+  const getPos = name => {
+    let pos = positionCache.get(name);
+    if (pos) return pos;
+    const idx = boneIndexMap[name];
+    const bone = skeleton.bones[idx];
+    if (!bone) throw new Error(`Missing bone: ${name}`);
+    pos = new THREE.Vector3().setFromMatrixPosition(bone.matrixWorld);
+    positionCache.set(name, pos);
+    return pos;
+  };
+  const neckPoints = neckChain.map(getPos);
+  const baseRadius = options.baseRadius || 0.12; 
+  const neckRadius = options.neckRadius || 0.08;
+  const radii = [baseRadius, neckRadius];
+
+  const positions = [];
+  const normals = [];
+  const skinIndices = [];
+  const skinWeights = [];
+  const uvs = [];
+  const capSegments = 2;
+  // Body strips plus the head cap (capSegments strips and an apex fan)
+  const indices = new Uint32Array(((neckPoints.length - 1 + capSegments) * 2 + 1) * sides * 3);
+  let indexOffset = 0;
+  const ringStarts = [];
+
+  const ringBuffer = new Float32Array(sides * 3);
+  for (let i = 0; i < neckPoints.length; i++) {
+    const center = neckPoints[i];
+    const prev = (i === 0) ? neckPoints[i] : neckPoints[i - 1];
+    const next = (i === neckPoints.length - 1) ? neckPoints[i] : neckPoints[i + 1];
+    let axis = next.clone().sub(prev).normalize();
+    if (axis.lengthSq() < 1e-6) axis = new THREE.Vector3(0, 1, 0);
+    const up = Math.abs(axis.y) > 0.99 ? new THREE.Vector3(1, 0, 0) : new THREE.Vector3(0, 1, 0);
+    
+    // Use imported createRing
+    const ring = createRing(center, axis, radii[i], sides, up, ringBuffer);
+
+    ringStarts.push(positions.length / 3);
+    for (let j = 0, k = 0; j < sides; j++, k += 3) {
+      const x = ring[k], y = ring[k + 1], z = ring[k + 2];
+      positions.push(x, y + yOffset, z);
+      const nx = x - center.x, ny = y - center.y, nz = z - center.z;
+      const invLen = 1 / (Math.hypot(nx, ny, nz) || 1);
+      normals.push(nx * invLen, ny * invLen, nz * invLen);
+      uvs.push(j / sides, i / (neckPoints.length - 1));
+      let boneA, boneB, wa, wb;
+      if (i === 0) {
+        boneA = boneIndexMap[neckChain[0]];
+        boneB = boneA; wa = 1; wb = 0;
+      } else if (i === neckPoints.length - 1) {
+        boneA = boneIndexMap[neckChain[neckChain.length - 1]];
+        boneB = boneA; wa = 1; wb = 0;
+      } else {
+        boneA = boneIndexMap[neckChain[i - 1]];
+        boneB = boneIndexMap[neckChain[i]];
+        wa = 0.5; wb = 0.5;
+      }
+      skinIndices.push(boneA, boneB, 0, 0);
+      skinWeights.push(wa, wb, 0, 0);
+    }
+  }
+
+  for (let seg = 0; seg < neckPoints.length - 1; seg++) {
+    indexOffset = bridgeRings(ringStarts[seg], ringStarts[seg + 1], sides, indices, indexOffset);
+  }
+
+  const rimStartIdx = ringStarts[ringStarts.length - 1];
+  const rimVerts = [];
+  for (let j = 0; j < sides; j++) {
+    rimVerts.push(new THREE.Vector3(
+      positions[(rimStartIdx + j) * 3 + 0],
+      positions[(rimStartIdx + j) * 3 + 1],
+      positions[(rimStartIdx + j) * 3 + 2]
+    ));
+  }
+  const neckTop = getPos('spine_neck');
+  const headPos = getPos('head');
+  const apex = neckTop.clone().lerp(headPos, 0.5);
+
+  for (let seg = 1; seg <= capSegments; seg++) {
+    const t = seg / capSegments;
+    for (let j = 0; j < sides; j++) {
+      const rimVert = rimVerts[j];
+      const v = rimVert.clone().lerp(apex, t);
+      positions.push(v.x, v.y, v.z);
+      const normal = apex.clone().sub(rimVert).normalize();
+      normals.push(normal.x, normal.y, normal.z);
+      uvs.push(j / sides, t);
+      let skinA = boneIndexMap['spine_neck'];
+      let skinB = boneIndexMap['head'];
+      let wa = 1 - t;
+      let wb = t;
+      skinIndices.push(skinA, skinB, 0, 0);
+      skinWeights.push(wa, wb, 0, 0);
+    }
+  }
+  positions.push(apex.x, apex.y, apex.z);
+  normals.push(0, 0, 1);
+  uvs.push(0.5, 1);
+  skinIndices.push(boneIndexMap['head'], boneIndexMap['head'], 0, 0);
+  skinWeights.push(1, 0, 0, 0);
+  const apexIdx = positions.length / 3 - 1;
+
+  indexOffset = capRings(rimStartIdx, capSegments, apexIdx, sides, indices, indexOffset);
+
+  const geometry = buildBufferGeometry({
+    positions, normals, skinIndices, skinWeights, uvs, indices
+  });
+  return geometry;
+}
@@ -0,0 +1,79 @@
+
+// src/animals/bodyParts/TailGenerator.js
+import * as THREE from 'three';
+import { createRing, bridgeRings, buildBufferGeometry, getBoneIndexMap } from '../../utils/GeometryBuilder.js';
+
+// Bone world matrices are read as-is; the caller brings them up to date.
+export function generateTailGeometry(skeleton, options = {}) {
+  const tailBoneNames = options.bones || ['tail_base', 'tail_mid', 'tail_tip'];
+  const sides = options.sides || 6;
+  const baseRadius = options.baseRadius || 0.08;
+  const midRadius  = options.midRadius  || 0.07;
+  const tipRadius  = options.tipRadius  || 0.05;
+  const yOffset = options.yOffset || 0;
+
+  const boneIndexMap = getBoneIndexMap(skeleton);
+
+  const allTailBoneNames = ['spine_base', ...tailBoneNames];
+  const tailPoints = allTailBoneNames.map(name => {
+    const idx = boneIndexMap[name];
+    if (idx === undefined) throw new Error(`Missing bone: ${name}`);
+    return new THREE.Vector3().setFromMatrixPosition(skeleton.bones[idx].matrixWorld);
+  });
+
+  let radii;
+  if (options.radii && Array.isArray(options.radii)) {
+    radii = options.radii;
+  } else if (allTailBoneNames.length === 4) { 
+    radii = [baseRadius, baseRadius, midRadius, tipRadius];
+  } else {
+    radii = [];
+    for (let i = 0; i < tailPoints.length; i++) {
+      const t = i / (tailPoints.length - 1);
+      radii.push(THREE.MathUtils.lerp(baseRadius, tipRadius, t));
+    }
+  }
+
+  const positions = [];
+  const normals = [];
+  const skinIndices = [];
+  const skinWeights = [];
+  const uvs = [];
+  // One bridged quad strip per segment
+  const indices = new Uint32Array((tailPoints.length - 1) * sides * 6);
+  let indexOffset = 0;
+  const ringStarts = [];
+
+  const ringBuffer = new Float32Array(sides * 3);
+  for (let i = 0; i < tailPoints.length; i++) {
+    const center = tailPoints[i];
+    const axis =
+      (i === tailPoints.length - 1)
+        ? center.clone().sub(tailPoints[i - 1]).normalize()
+        : tailPoints[i + 1].clone().sub(center).normalize();
+
+    const ring = createRing(center, axis, radii[i], sides, undefined, ringBuffer);
+    ringStarts.push(positions.length / 3);
+
+    for (let j = 0, k = 0; j < sides; j++, k += 3) {
+      const x = ring[k], y = ring[k + 1], z = ring[k + 2];
+      positions.push(x, y + yOffset, z);
+      const nx = x - center.x, ny = y - center.y, nz = z - center.z;
+      const invLen = 1 / (Math.hypot(nx, ny, nz) || 1);
+      normals.push(nx * invLen, ny * invLen, nz * invLen);
+      uvs.push(j / sides, i / (tailPoints.length - 1));
+      const mainBone = boneIndexMap[allTailBoneNames[i]];
+      skinIndices.push(mainBone, mainBone, 0, 0);
+      skinWeights.push(1, 0, 0, 0);
+    }
+  }
+
+  for (let seg = 0; seg < tailPoints.length - 1; seg++) {
+    indexOffset = bridgeRings(ringStarts[seg], ringStarts[seg + 1], sides, indices, indexOffset);
+  }
+
+  const geometry = buildBufferGeometry({
+    positions, normals, skinIndices, skinWeights, uvs, indices
+  });
+  return geometry;
+}
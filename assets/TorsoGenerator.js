@@ -0,0 +1,215 @@
+
+// src/animals/bodyParts/TorsoGenerator.js
+import * as THREE from 'three';
+import { createRing, bridgeRings, capRings, buildBufferGeometry, getBoneIndexMap } from '../../utils/GeometryBuilder.js';
+
+// Scratch vectors reused by the ring and cap loops
+const _axis = new THREE.Vector3();
+const _center = new THREE.Vector3();
+const _v = new THREE.Vector3();
+const _normal = new THREE.Vector3();
+
+// Bone world matrices are read as-is; the caller brings them up to date.
+// Unit direction from packed centre a to packed centre b, written into out.
+function axisBetween(centers, a, b, out) {
+  const ia = a * 3, ib = b * 3;
+  return out.set(
+    centers[ib] - centers[ia],
+    centers[ib + 1] - centers[ia + 1],
+    centers[ib + 2] - centers[ia + 2]
+  ).normalize();
+}
+
+export function generateTorsoGeometry(skeleton, options = {}) {
+  const spineBoneNames = options.bones || ['spine_base', 'spine_mid'];
+  const sides = options.sides || 8; 
+
+  const boneIndexMap = getBoneIndexMap(skeleton);
+
+  // Each bone's world position is read once; callers must not mutate it.
+  const positionCache = new Map();
+  const getPos = name => {
+    let pos = positionCache.get(name);
+    if (pos) return pos;
+    const idx = boneIndexMap[name];
+    const bone = skeleton.bones[idx];
+    if (!bone) throw new Error(`Missing bone: ${name}`);
+    pos = new THREE.Vector3().setFromMatrixPosition(bone.matrixWorld);
+    positionCache.set(name, pos);
+    return pos;
+  };
+  const leftPelvis = getPos('back_left_pelvis');
+  const rightPelvis = getPos('back_right_pelvis');
+  const rearCenter = leftPelvis.clone().lerp(rightPelvis, 0.5);
+  const rearRadius = leftPelvis.distanceTo(rightPelvis) / 2;
+
+  const spinePoints = spineBoneNames.map(getPos);
+  const leftCollar = getPos('front_left_collarbone');
+  const rightCollar = getPos('front_right_collarbone');
+  const frontCenter = leftCollar.clone().lerp(rightCollar, 0.5);
+  const frontRadius = leftCollar.distanceTo(rightCollar) / 2;
+
+  const useShoulderBase = true; 
+  let ringCenters, radii, skinRefs;
+
+  if (useShoulderBase) {
+    const spineMid = spinePoints[spinePoints.length - 1];
+    const shoulderBase = spineMid.clone().lerp(frontCenter, 0.5);
+    const shoulderRadius = (spineMid.distanceTo(frontCenter) / 2 + frontRadius) / 2;
+    ringCenters = [rearCenter, ...spinePoints, shoulderBase, frontCenter];
+    radii = [rearRadius, ...spinePoints.map((_, i) => 0.16 - 0.03 * i), shoulderRadius, frontRadius];
+    skinRefs = [
+      spineBoneNames[0], 
+      ...spineBoneNames, 
+      spineBoneNames[spineBoneNames.length - 1], 
+      spineBoneNames[spineBoneNames.length - 1], 
+    ];
+  } else {
+    ringCenters = [rearCenter, ...spinePoints, frontCenter];
+    radii = [rearRadius, ...spinePoints.map((_, i) => 0.16 - 0.03 * i), frontRadius];
+    skinRefs = [
+      spineBoneNames[0],
+      ...spineBoneNames,
+      spineBoneNames[spineBoneNames.length - 1],
+    ];
+  }
+
+  // Ring centres and radii packed flat for the ring loop
+  const ringCount = ringCenters.length;
+  const centers = new Float64Array(ringCount * 3);
+  ringCenters.forEach((center, i) => center.toArray(centers, i * 3));
+  const ringRadii = Float64Array.from(radii);
+
+  const rearCapSegments = 2;
+  const capSegments = 2;
+  const vertexCount =
+    ringCount * sides +
+    (rearCapSegments + 1) * sides + 1 +
+    (capSegments + 1) * sides + 1;
+  const positions = new Float32Array(vertexCount * 3);
+  const normals = new Float32Array(vertexCount * 3);
+  const skinIndices = new Uint8Array(vertexCount * 4);
+  const skinWeights = new Float32Array(vertexCount * 4);
+  const uvs = new Float32Array(vertexCount * 2);
+  let vertex = 0;
+  const writeVertex = (x, y, z, nx, ny, nz, u, v, boneA, boneB, wa, wb) => {
+    const p = vertex * 3, s = vertex * 4, t = vertex * 2;
+    positions[p] = x; positions[p + 1] = y; positions[p + 2] = z;
+    normals[p] = nx; normals[p + 1] = ny; normals[p + 2] = nz;
+    uvs[t] = u; uvs[t + 1] = v;
+    skinIndices[s] = boneA; skinIndices[s + 1] = boneB;
+    skinWeights[s] = wa; skinWeights[s + 1] = wb;
+    return vertex++;
+  };
+  // Body strips plus the rear and front caps (strips and an apex fan each)
+  const indices = new Uint32Array(
+    ((ringCount - 1 + rearCapSegments + capSegments) * 2 + 2) * sides * 3
+  );
+  let indexOffset = 0;
+  const yOffset = options.yOffset || 0.0;
+
+  const ringBuffer = new Float32Array(sides * 3);
+  for (let i = 0; i < ringCount; i++) {
+    const cx = centers[i * 3], cy = centers[i * 3 + 1], cz = centers[i * 3 + 2];
+    const axis =
+      (i === ringCount - 1)
+        ? axisBetween(centers, i - 1, i, _axis)
+        : axisBetween(centers, i, i + 1, _axis);
+    const ring = createRing(_center.set(cx, cy, cz), axis, ringRadii[i], sides, undefined, ringBuffer);
+    const mainBone = boneIndexMap[skinRefs[i]];
+
+    for (let j = 0, k = 0; j < sides; j++, k += 3) {
+      const x = ring[k], y = ring[k + 1], z = ring[k + 2];
+      const nx = x - cx, ny = y - cy, nz = z - cz;
+      const invLen = 1 / (Math.hypot(nx, ny, nz) || 1);
+      writeVertex(
+        x, y + yOffset, z,
+        nx * invLen, ny * invLen, nz * invLen,
+        j / sides, i / (ringCount - 1),
+        mainBone, mainBone, 1, 0
+      );
+    }
+  }
+
+  for (let seg = 0; seg < ringCount - 1; seg++) {
+    indexOffset = bridgeRings(seg * sides, (seg + 1) * sides, sides, indices, indexOffset);
+  }
+
+	const rearRimIdx = 1; 
+	const rearRimStartIdx = rearRimIdx * sides;
+
+	const rearRimVerts = [];
+	for (let j = 0; j < sides; j++) {
+	  rearRimVerts.push(new THREE.Vector3().fromArray(positions, (rearRimStartIdx + j) * 3));
+	}
+
+	const lastRingCenter = ringCenters[rearRimIdx];
+	const lastRingRadius = ringRadii[rearRimIdx];
+	const rearApex = lastRingCenter.clone().add(
+	  _axis.subVectors(getPos('tail_base'), lastRingCenter).normalize()
+		.multiplyScalar((lastRingRadius + (options.rearCapBulge || 0.035)) * 1.15)
+	);
+
+	const rearBaseIdx = vertex;
+	const rearSkinA = boneIndexMap[skinRefs[rearRimIdx]];
+	const tailBone = boneIndexMap['tail_base'];
+	for (let seg = 0; seg <= rearCapSegments; seg++) {
+	  const t = seg / rearCapSegments; 
+	  for (let j = 0; j < sides; j++) {
+		const v = (seg === 0)
+		  ? _v.copy(rearRimVerts[j])
+		  : _v.lerpVectors(rearRimVerts[j], rearApex, t);
+		const normal = (seg === 0)
+		  ? _normal.subVectors(v, lastRingCenter).normalize()
+		  : _normal.subVectors(rearApex, rearRimVerts[j]).normalize();
+		writeVertex(
+		  v.x, v.y, v.z, normal.x, normal.y, normal.z,
+		  j / sides, t, rearSkinA, tailBone, 1 - t, t
+		);
+	  }
+	}
+	const rearApexIdx = writeVertex(
+	  rearApex.x, rearApex.y, rearApex.z, 0, 0, -1,
+	  0.5, 1, tailBone, tailBone, 1, 0
+	);
+
+	indexOffset = capRings(rearBaseIdx, rearCapSegments, rearApexIdx, sides, indices, indexOffset);
+
+	const neckBase = getPos('spine_neck');
+	const rimStartIdx = (ringCount - 1) * sides;
+
+	const rimVerts = [];
+	for (let j = 0; j < sides; j++) {
+	  rimVerts.push(new THREE.Vector3().fromArray(positions, (rimStartIdx + j) * 3));
+	}
+
+	const frontBaseIdx = vertex;
+	const frontSkinA = boneIndexMap[skinRefs[skinRefs.length - 1]];
+	const neckBone = boneIndexMap['spine_neck'];
+	for (let seg = 0; seg <= capSegments; seg++) {
+	  const t = seg / capSegments; 
+	  for (let j = 0; j < sides; j++) {
+		const v = (seg === 0)
+		  ? _v.copy(rimVerts[j])
+		  : _v.lerpVectors(rimVerts[j], neckBase, t);
+		const normal = (seg === 0)
+		  ? _normal.subVectors(v, frontCenter).normalize()
+		  : _normal.subVectors(neckBase, rimVerts[j]).normalize();
+		writeVertex(
+		  v.x, v.y, v.z, normal.x, normal.y, normal.z,
+		  j / sides, t, frontSkinA, neckBone, 1 - t, t
+		);
+	  }
+	}
+	const frontApexIdx = writeVertex(
+	  neckBase.x, neckBase.y, neckBase.z, 0, 0, 1,
+	  0.5, 1, neckBone, neckBone, 1, 0
+	);
+
+	indexOffset = capRings(frontBaseIdx, capSegments, frontApexIdx, sides, indices, indexOffset);
+
+  const geometry = buildBufferGeometry({
+    positions, normals, skinIndices, skinWeights, uvs, indices
+  });
+  return geometry;
+}
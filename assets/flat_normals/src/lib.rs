@@ -0,0 +1,64 @@
+//! Flat (per-face) normals for a triangle soup, four lanes at a time.
+//!
+//! Build with `cargo build --release` from this directory, then copy
+//! `target/wasm32-unknown-unknown/release/flat_normals.wasm` to
+//! `assets/flat_normals.wasm` so test2.py ships it as `libs/flat_normals.wasm`.
+//!
+//! Positions and normals are tightly packed xyz floats, nine per triangle.
+//! Every vertex is moved as a whole 4-lane vector, so both buffers need one
+//! float of padding after the last triangle.
+
+use core::arch::wasm32::*;
+
+/// Allocates `len` floats in linear memory for the JS side to fill.
+#[no_mangle]
+pub extern "C" fn alloc_f32(len: usize) -> *mut f32 {
+    let mut buf = Vec::<f32>::with_capacity(len);
+    let ptr = buf.as_mut_ptr();
+    core::mem::forget(buf);
+    ptr
+}
+
+/// Releases a buffer returned by `alloc_f32` with the same `len`.
+///
+/// # Safety
+/// `ptr` must come from `alloc_f32(len)` and not have been freed already.
+#[no_mangle]
+pub unsafe extern "C" fn free_f32(ptr: *mut f32, len: usize) {
+    drop(Vec::from_raw_parts(ptr, 0, len));
+}
+
+/// Writes the unit face normal of each triangle to all three of its corners.
+///
+/// # Safety
+/// `positions` and `normals` must each hold `tri_count * 9 + 1` floats.
+#[no_mangle]
+#[target_feature(enable = "simd128")]
+pub unsafe extern "C" fn flat_normals(positions: *const f32, tri_count: usize, normals: *mut f32) {
+    for t in 0..tri_count {
+        let p = positions.add(t * 9);
+        let a = v128_load(p as *const v128);
+        let b = v128_load(p.add(3) as *const v128);
+        let c = v128_load(p.add(6) as *const v128);
+
+        // cross(e, f) = e.yzx * f.zxy - e.zxy * f.yzx; lane 3 is don't-care.
+        let e = f32x4_sub(b, a);
+        let f = f32x4_sub(c, a);
+        let e_yzx = i32x4_shuffle::<1, 2, 0, 3>(e, e);
+        let e_zxy = i32x4_shuffle::<2, 0, 1, 3>(e, e);
+        let f_yzx = i32x4_shuffle::<1, 2, 0, 3>(f, f);
+        let f_zxy = i32x4_shuffle::<2, 0, 1, 3>(f, f);
+        let n = f32x4_sub(f32x4_mul(e_yzx, f_zxy), f32x4_mul(e_zxy, f_yzx));
+
+        let sq = f32x4_mul(n, n);
+        let len = (f32x4_extract_lane::<0>(sq) + f32x4_extract_lane::<1>(sq) + f32x4_extract_lane::<2>(sq)).sqrt();
+        let n = f32x4_mul(n, f32x4_splat(if len > 0.0 { 1.0 / len } else { 1.0 }));
+
+        // Overlapping stores: each one's fourth lane is overwritten by the
+        // next, and the last spills into the padding float.
+        let o = normals.add(t * 9);
+        v128_store(o as *mut v128, n);
+        v128_store(o.add(3) as *mut v128, n);
+        v128_store(o.add(6) as *mut v128, n);
+    }
+}
@@ -0,0 +1,31 @@
+// src/workers/geometryWorker.js
+//
+// Builds the elephant body off the main thread. The request carries the bone
+// definitions and generator options; the reply carries every attribute's
+// typed array, transferred rather than copied.
+
+import * as THREE from 'three';
+import { buildBonesFromDefinition, buildElephantGeometry } from '../animals/Elephant/ElephantGeometry.js';
+import { initFlatNormals } from '../utils/GeometryBuilder.js';
+
+self.onmessage = async ({ data }) => {
+  const { skeletonDefinition, options } = data;
+  try {
+    // The worker builds once and is terminated, so wait for the flat-normal
+    // kernel here rather than racing the load started at import.
+    await initFlatNormals();
+    const bones = buildBonesFromDefinition(skeletonDefinition);
+    const geometry = buildElephantGeometry(new THREE.Skeleton(bones), options);
+
+    const attributes = {};
+    const transfer = [];
+    for (const [name, attribute] of Object.entries(geometry.attributes)) {
+      const { array, itemSize, normalized } = attribute;
+      attributes[name] = { array, itemSize, normalized };
+      transfer.push(array.buffer);
+    }
+    self.postMessage({ attributes }, transfer);
+  } catch (err) {
+    self.postMessage({ error: err.message });
+  }
+};
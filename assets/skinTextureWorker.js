@@ -0,0 +1,20 @@
+// src/workers/skinTextureWorker.js
+//
+// Paints the elephant skin on an OffscreenCanvas off the main thread and
+// replies with the result as an ImageBitmap, transferred rather than copied.
+
+import { paintElephantSkin } from '../animals/Elephant/ElephantSkinPattern.js';
+
+self.onmessage = ({ data }) => {
+  const { size, seed } = data;
+  try {
+    const canvas = new OffscreenCanvas(size, size);
+    const ctx = canvas.getContext('2d');
+    if (!ctx) throw new Error('OffscreenCanvas 2d context unavailable');
+    paintElephantSkin(ctx, size, seed);
+    const bitmap = canvas.transferToImageBitmap();
+    self.postMessage({ bitmap }, [bitmap]);
+  } catch (err) {
+    self.postMessage({ error: err.message });
+  }
+};
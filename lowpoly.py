@@ -5,8 +5,9 @@ Mesh Simplifier GUI
 A Tkinter application that:
 - Accepts 3D mesh files (OBJ, PLY, STL, etc.)
 - Lets you drag & drop a file or choose via a file dialog
-- Simplifies the mesh using PyVista's decimate_pro (low-poly / faceted look)
+- Simplifies the mesh using quadric-error decimation (low-poly / faceted look)
 - Saves the simplified mesh next to the input with a "_lowpoly" suffix
+  (as binary PLY for OBJ/STL input unless "Same as input" is selected)
 - Renders a preview image of the simplified mesh and shows it in the GUI
 
 Dependencies:
@@ -15,9 +16,14 @@ Dependencies:
 If tkinterdnd2 is not installed, drag & drop is disabled but the app still works.
 """
 
+import io
+import itertools
+import math
+import re
 import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -32,33 +38,156 @@ except ImportError:
     DND_FILES = None   # type: ignore[assignment]
     DND_AVAILABLE = False
 
+import numpy as np
 import pyvista as pv
-from PIL import Image, ImageTk
+from PIL import Image
+from vtkmodules.util import numpy_support
+from vtkmodules.vtkCommonDataModel import VTK_TRIANGLE, vtkCellTypes
+from vtkmodules.vtkCommonExecutionModel import vtkTrivialProducer
+from vtkmodules.vtkFiltersCore import (
+    vtkDecimatePro,
+    vtkQuadricClustering,
+    vtkQuadricDecimation,
+    vtkTriangleFilter,
+)
+from vtkmodules.vtkFiltersGeometry import vtkDataSetSurfaceFilter
+from vtkmodules.vtkIOGeometry import (
+    vtkOBJReader,
+    vtkOBJWriter,
+    vtkSTLReader,
+    vtkSTLWriter,
+)
+from vtkmodules.vtkIOPLY import vtkPLYReader, vtkPLYWriter
+from vtkmodules.vtkIOXML import vtkXMLPolyDataReader, vtkXMLPolyDataWriter
 
 # Global off-screen flag for PyVista (used by some helpers)
 pv.OFF_SCREEN = True
 
+# Tokenizes a TkDnD drop payload: either a {braced path} or a bare word
+_DND_RE = re.compile(r"\{([^}]*)\}|(\S+)")
+
+# Native VTK readers/writers for surface formats that can be streamed through
+# a single VTK pipeline. Anything else falls back to pv.read / PolyData.save.
+_VTK_READERS = {
+    ".obj": vtkOBJReader,
+    ".ply": vtkPLYReader,
+    ".stl": vtkSTLReader,
+    ".vtp": vtkXMLPolyDataReader,
+}
+_VTK_WRITERS = {
+    ".obj": vtkOBJWriter,
+    ".ply": vtkPLYWriter,
+    ".stl": vtkSTLWriter,
+    ".vtp": vtkXMLPolyDataWriter,
+}
+
+# Worker-process state: background writer used so saves overlap preview
+# rendering, and each run's simplified mesh and in-flight save, keyed by run
+# id until the full-size render that follows the low-resolution one. Runs
+# queue up in the single worker, so a render must not just take the latest.
+_SAVE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PENDING_RUNS: Dict[int, Tuple[pv.PolyData, Future]] = {}
+
+# Output format choices for OBJ/STL input
+OUTPUT_FORMAT_PLY = "Binary PLY"
+OUTPUT_FORMAT_SAME = "Same as input"
+
+# Longest side of the quick preview shown before the full-size render
+PREVIEW_LOW_RES = 256
+
+# fast_mode only clusters meshes larger than this many triangles
+FAST_MODE_MIN_TRIANGLES = 1_000_000
+
+# Off-screen plotter shared by every preview render. Creating a Plotter
+# rebuilds the render window and GL context, so it is created lazily once
+# and never closed.
+_PREVIEW_PLOTTER: Optional[pv.Plotter] = None
+_PREVIEW_PLOTTER_LOCK = threading.Lock()
+
+# Pixel buffer reused by every preview render (and its VTK array view);
+# reallocated only when the render window size changes.
+_SCREENSHOT_BUF: Optional[np.ndarray] = None
+_SCREENSHOT_PIXELS = None
+
+
+def _is_all_triangles(mesh: pv.PolyData) -> bool:
+    """
+    Fast replacement for PolyData.is_all_triangles.
+
+    Reads VTK's cell connectivity through a zero-copy NumPy view instead of
+    PolyData.faces, which rebuilds the legacy [n, i, j, k, ...] array on
+    every access. Like PyVista, a mesh with no polygons, or with any
+    vertices, lines or strips, is not triangle-only. Every polygon has at
+    least three points, so the polygons are all triangles exactly when
+    there are three ids per cell.
+    """
+    if mesh.GetNumberOfVerts() or mesh.GetNumberOfLines() or mesh.GetNumberOfStrips():
+        return False
+    polys = mesh.GetPolys()
+    n_cells = polys.GetNumberOfCells()
+    if n_cells == 0:
+        return False
+    connectivity = numpy_support.vtk_to_numpy(polys.GetConnectivityArray())
+    return connectivity.size == 3 * n_cells
+
+
+def _triangle_filter(upstream) -> vtkTriangleFilter:
+    """
+    Connect a vtkTriangleFilter (polygons only) downstream of a VTK algorithm.
+
+    Triangulating inside the pipeline avoids building an intermediate
+    PolyData in Python, as PolyData.triangulate() would.
+    """
+    triangles = vtkTriangleFilter()
+    triangles.SetInputConnection(upstream.GetOutputPort())
+    triangles.PassVertsOff()
+    triangles.PassLinesOff()
+    return triangles
+
 
 def simplify_mesh(
     input_path: Path,
-    output_path: Path,
     reduction: float,
     preserve_topology: bool,
+    volume_preservation: bool = False,
+    attribute_error: bool = False,
+    fast_mode: bool = False,
 ) -> Tuple[pv.PolyData, pv.PolyData]:
     """
-    Load a mesh, decimate it using PyVista's decimate_pro, and save the result.
+    Load a mesh and decimate it.
+
+    Reading, triangulation and decimation run as one VTK pipeline
+    (reader -> vtkTriangleFilter -> vtkQuadricDecimation) so the data only
+    crosses into Python once, when wrapped for the caller. vtkDecimatePro
+    replaces the quadric decimator when preserve_topology is set.
+
+    With fast_mode, meshes above FAST_MODE_MIN_TRIANGLES are first reduced
+    with vtkQuadricClustering (linear-time vertex clustering on a voxel grid)
+    to roughly 4x the target triangle count, and quadric decimation only
+    trims the remainder.
+
+    The result is not written to disk; use save_mesh for that, which lets
+    the caller overlap the save with preview rendering.
 
     Parameters
     ----------
     input_path : Path
         Path to the input mesh file (OBJ, PLY, STL, etc.).
-    output_path : Path
-        Path to write the simplified mesh.
     reduction : float
         Fraction of triangles to remove. 0.8 removes 80% of triangles,
         leaving about 20% of the original detail.
     preserve_topology : bool
-        Pass through to decimate_pro(preserve_topology=...).
+        If True, use vtkDecimatePro with PreserveTopologyOn() instead of
+        quadric decimation.
+    volume_preservation : bool
+        vtkQuadricDecimation.SetVolumePreservation. Ignored when
+        preserve_topology is True.
+    attribute_error : bool
+        vtkQuadricDecimation.SetAttributeErrorMetric. Ignored when
+        preserve_topology is True.
+    fast_mode : bool
+        Run a vtkQuadricClustering pre-pass on very large meshes. Ignored
+        when preserve_topology is True.
 
     Returns
     -------
@@ -68,44 +197,145 @@ def simplify_mesh(
         The simplified (decimated) mesh.
     """
     print(f"[simplify_mesh] Loading mesh from: {input_path}")
-    mesh = pv.read(str(input_path))
-
-    # Ensure we have a PolyData surface with triangles.
-    if not isinstance(mesh, pv.PolyData):
-        print("[simplify_mesh] Input is not PolyData; extracting surface.")
-        mesh = mesh.extract_surface()
-
-    # is_all_triangles is a PROPERTY, not a method → no parentheses
-    # https://docs.pyvista.org/api/core/_autosummary/pyvista.PolyData.is_all_triangles.html
-    if not mesh.is_all_triangles:
-        print("[simplify_mesh] Mesh is not all triangles; triangulating.")
-        mesh = mesh.triangulate()
-
-    print("[simplify_mesh] Original mesh summary:")
-    print(mesh)
+    suffix = input_path.suffix.lower()
+    reader_cls = _VTK_READERS.get(suffix)
+
+    if reader_cls is not None:
+        source = reader_cls()
+        source.SetFileName(str(input_path))
+
+        # STL is always triangles, so only formats that may contain
+        # polygons get the triangulation stage.
+        if suffix == ".stl":
+            # Skip per-solid scalar tags. Point merging stays on: STL is a
+            # triangle soup and the decimator cannot collapse edges between
+            # unmerged triangles. This is the only merge pass in the
+            # pipeline; indexed formats (OBJ/PLY/VTP) already share vertices
+            # and go to the decimator unmerged.
+            source.ScalarTagsOff()
+            source.MergingOn()
+            surface = source
+        else:
+            # Free the reader's copy of the mesh once the triangle filter has
+            # consumed it, so a large file is not held in memory twice.
+            source.ReleaseDataFlagOn()
+            surface = _triangle_filter(source)
+    else:
+        mesh = pv.read(str(input_path))
+
+        if isinstance(mesh, pv.PolyData):
+            surface = vtkTrivialProducer()
+            surface.SetOutput(mesh)
+
+            if not _is_all_triangles(mesh):
+                print("[simplify_mesh] Mesh is not all triangles; triangulating.")
+                surface = _triangle_filter(surface)
+        else:
+            # Extract the surface and triangulate in one pipeline so the
+            # geometry is not materialised as an intermediate PolyData.
+            print("[simplify_mesh] Input is not PolyData; extracting surface.")
+            surface = vtkDataSetSurfaceFilter()
+            surface.SetInputData(mesh)
+            surface.Update()
+
+            cell_types = vtkCellTypes()
+            surface.GetOutput().GetCellTypes(cell_types)
+            all_triangles = (
+                cell_types.GetNumberOfTypes() == 1
+                and cell_types.GetCellType(0) == VTK_TRIANGLE
+            )
+            if not all_triangles:
+                print("[simplify_mesh] Surface is not all triangles; triangulating.")
+                surface = _triangle_filter(surface)
+
+    decimator_input = surface
+    decimator_reduction = reduction
+
+    if fast_mode and not preserve_topology:
+        surface.Update()
+        n_triangles = surface.GetOutputDataObject(0).GetNumberOfCells()
+        if n_triangles > FAST_MODE_MIN_TRIANGLES:
+            target_triangles = max(1, int(n_triangles * (1.0 - reduction)))
+            # A closed surface in a d^3 grid touches ~pi*d^2 cells and yields
+            # about two triangles per touched cell.
+            divisions = max(
+                8, int(math.sqrt(4 * target_triangles / (2.0 * math.pi)))
+            )
+            print(
+                f"[simplify_mesh] Fast mode: clustering {n_triangles} triangles "
+                f"on a {divisions}^3 grid."
+            )
+            clustering = vtkQuadricClustering()
+            clustering.SetInputConnection(surface.GetOutputPort())
+            clustering.SetNumberOfDivisions(divisions, divisions, divisions)
+            clustering.Update()
+
+            n_clustered = clustering.GetOutput().GetNumberOfCells()
+            decimator_input = clustering
+            decimator_reduction = max(
+                0.0, 1.0 - target_triangles / max(n_clustered, 1)
+            )
 
     print(
-        f"[simplify_mesh] Decimating with reduction={reduction:.3f}, "
+        f"[simplify_mesh] Decimating with reduction={decimator_reduction:.3f}, "
         f"preserve_topology={preserve_topology}"
     )
 
-    simplified = mesh.decimate_pro(
-        reduction=reduction,
-        preserve_topology=preserve_topology,
-        inplace=False,
-        progress_bar=False,
-    )
+    if preserve_topology:
+        decimator = vtkDecimatePro()
+        decimator.PreserveTopologyOn()
+        # Match the PyVista decimate_pro default
+        decimator.SetFeatureAngle(45.0)
+    else:
+        # Quadric-error decimation
+        decimator = vtkQuadricDecimation()
+        decimator.SetVolumePreservation(volume_preservation)
+        decimator.SetAttributeErrorMetric(attribute_error)
+    decimator.SetTargetReduction(decimator_reduction)
+    decimator.SetInputConnection(decimator_input.GetOutputPort())
+
+    # Pulls the whole reader -> triangulate -> decimate pipeline through a
+    # single Update().
+    decimator.Update()
+
+    mesh = pv.wrap(surface.GetOutputDataObject(0))
+    simplified = pv.wrap(decimator.GetOutput())
 
+    print("[simplify_mesh] Original mesh summary:")
+    print(mesh)
     print("[simplify_mesh] Simplified mesh summary:")
     print(simplified)
-
-    print(f"[simplify_mesh] Saving simplified mesh to: {output_path}")
-    simplified.save(str(output_path))
     print("[simplify_mesh] Done.")
 
     return mesh, simplified
 
 
+def save_mesh(mesh: pv.PolyData, output_path: Path) -> None:
+    """
+    Write a mesh to disk, in binary form where the format supports it.
+
+    Parameters
+    ----------
+    mesh : pv.PolyData
+        Mesh to save.
+    output_path : Path
+        Destination path; the suffix selects the file format.
+    """
+    print(f"[save_mesh] Saving simplified mesh to: {output_path}")
+    writer_cls = _VTK_WRITERS.get(output_path.suffix.lower())
+    if writer_cls is not None:
+        writer = writer_cls()
+        writer.SetFileName(str(output_path))
+        if hasattr(writer, "SetFileTypeToBinary"):
+            # Same default as PolyData.save(binary=True)
+            writer.SetFileTypeToBinary()
+        writer.SetInputData(mesh)
+        writer.Write()
+    else:
+        mesh.save(str(output_path), binary=True)
+    print("[save_mesh] Done.")
+
+
 def render_preview_image(
     mesh: pv.PolyData,
     window_size: Tuple[int, int] = (512, 512),
@@ -113,6 +343,10 @@ def render_preview_image(
     """
     Render a preview image of the given mesh using an off-screen PyVista plotter.
 
+    The plotter (and its render window / OpenGL context) is created once and
+    reused across calls; only the mesh actor is swapped and the window is
+    resized when a different window_size is requested.
+
     Parameters
     ----------
     mesh : pv.PolyData
@@ -125,28 +359,135 @@ def render_preview_image(
     img : PIL.Image.Image
         A Pillow Image containing the rendered preview.
     """
+    global _PREVIEW_PLOTTER, _SCREENSHOT_BUF, _SCREENSHOT_PIXELS
+
     print("[render_preview_image] Rendering preview image...")
-    # Explicitly use off_screen=True here (supported Plotter kwarg)
-    # https://docs.pyvista.org/api/plotting/_autosummary/pyvista.Plotter.html
-    plotter = pv.Plotter(off_screen=True, window_size=window_size)
-    plotter.set_background("white")
-    plotter.add_mesh(
-        mesh,
-        color="lightgray",
-        show_edges=True,
-        edge_color="black",
-        line_width=0.5,
-    )
-    plotter.add_axes()
-    plotter.view_isometric()
-    img_array = plotter.screenshot(return_img=True)
-    plotter.close()
+    with _PREVIEW_PLOTTER_LOCK:
+        plotter = _PREVIEW_PLOTTER
+        if plotter is None:
+            # Explicitly use off_screen=True here (supported Plotter kwarg)
+            # https://docs.pyvista.org/api/plotting/_autosummary/pyvista.Plotter.html
+            plotter = pv.Plotter(off_screen=True, window_size=window_size)
+            plotter.set_background("white")
+            plotter.add_axes()
+            _PREVIEW_PLOTTER = plotter
+        else:
+            plotter.clear_actors()
+            if tuple(plotter.window_size) != tuple(window_size):
+                plotter.window_size = window_size
+
+        # Flat shading gives the faceted look from per-facet normals in a
+        # single draw call, without a separate edge/line pass.
+        plotter.add_mesh(mesh, color="lightgray", smooth_shading=False)
+        plotter.view_isometric()
+
+        # Read pixels straight from the render window instead of going
+        # through screenshot()'s vtkWindowToImageFilter copy.
+        render_window = plotter.render_window
+        render_window.Render()
+        width, height = render_window.GetSize()
+        if _SCREENSHOT_BUF is None or _SCREENSHOT_BUF.shape != (height, width, 4):
+            _SCREENSHOT_BUF = np.empty((height, width, 4), dtype=np.uint8)
+            # Zero-copy VTK view; VTK writes in place while the size matches
+            _SCREENSHOT_PIXELS = numpy_support.numpy_to_vtk(
+                _SCREENSHOT_BUF.reshape(-1), deep=False
+            )
+        # Off-screen windows render into the back buffer (front=0)
+        render_window.GetRGBACharPixelData(
+            0, 0, width - 1, height - 1, 0, _SCREENSHOT_PIXELS
+        )
 
-    image = Image.fromarray(img_array)
+        # VTK rows are bottom-up; flip and drop alpha for the RGB preview.
+        # The copy must happen under the lock since the buffer is shared.
+        img_array = _SCREENSHOT_BUF[::-1, :, :3]
+        image = Image.fromarray(np.ascontiguousarray(img_array))
     print("[render_preview_image] Preview rendering complete.")
     return image
 
 
+def _encode_png(image: Image.Image) -> bytes:
+    """
+    Encode a preview as PNG bytes for transfer out of the worker process.
+    """
+    png = io.BytesIO()
+    image.save(png, format="PNG", compress_level=1)
+    return png.getvalue()
+
+
+def _simplify_task(
+    run_id: int,
+    input_path: Path,
+    output_path: Path,
+    reduction: float,
+    preserve_topology: bool,
+    volume_preservation: bool,
+    attribute_error: bool,
+    fast_mode: bool,
+    window_size: Tuple[int, int],
+) -> Tuple[Path, bytes]:
+    """
+    Simplify a mesh and render a quick low-resolution preview; runs in the
+    worker process.
+
+    The save is started in the background and the simplified mesh is kept
+    in the worker under run_id so _render_task can follow up with the
+    full-size preview.
+    Only picklable values cross the process boundary: the output path and
+    the rendered preview encoded as PNG bytes.
+    """
+    global _SAVE_EXECUTOR
+
+    original, simplified = simplify_mesh(
+        input_path=input_path,
+        reduction=reduction,
+        preserve_topology=preserve_topology,
+        volume_preservation=volume_preservation,
+        attribute_error=attribute_error,
+        fast_mode=fast_mode,
+    )
+
+    # VTK releases the GIL while writing and rendering, so the save
+    # overlaps with both preview renders instead of delaying them.
+    if _SAVE_EXECUTOR is None:
+        _SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+    save = _SAVE_EXECUTOR.submit(save_mesh, simplified, output_path)
+    _PENDING_RUNS[run_id] = (simplified, save)
+
+    scale = min(1.0, PREVIEW_LOW_RES / max(window_size))
+    low_res_size = (
+        max(1, int(window_size[0] * scale)),
+        max(1, int(window_size[1] * scale)),
+    )
+    try:
+        preview_img = render_preview_image(simplified, window_size=low_res_size)
+    except Exception:
+        # The app reports this run as failed and never asks for its
+        # full-size render, so drop the mesh and settle the save here.
+        _PENDING_RUNS.pop(run_id, None)
+        if not save.cancel():
+            save.exception()
+        raise
+
+    return output_path, _encode_png(preview_img)
+
+
+def _render_task(run_id: int, window_size: Tuple[int, int]) -> bytes:
+    """
+    Render the full-size preview of the mesh from the _simplify_task with the
+    same run_id and wait for its save to finish; runs in the worker process.
+    """
+    pending = _PENDING_RUNS.pop(run_id, None)
+    if pending is None:
+        raise RuntimeError("No simplified mesh to render.")
+    simplified, save = pending
+
+    # Reuses the cached plotter, so this only resizes the render window.
+    preview_img = render_preview_image(simplified, window_size=window_size)
+    save.result()
+
+    return _encode_png(preview_img)
+
+
 if DND_AVAILABLE:
     BaseTk = TkinterDnD.Tk  # type: ignore[assignment]
 else:
@@ -168,10 +509,28 @@ class MeshSimplifierApp(BaseTk):
         self.input_path_var = tk.StringVar(value="")
         self.reduction_var = tk.DoubleVar(value=0.8)
         self.preserve_topology_var = tk.BooleanVar(value=False)
+        self.volume_preservation_var = tk.BooleanVar(value=False)
+        self.attribute_error_var = tk.BooleanVar(value=False)
+        self.fast_mode_var = tk.BooleanVar(value=False)
+        self.output_format_var = tk.StringVar(value=OUTPUT_FORMAT_PLY)
         self.status_var = tk.StringVar(value="Drop a mesh file or click 'Browse...'")
 
         self.preview_image: Optional[Image.Image] = None
-        self.preview_photo: Optional[ImageTk.PhotoImage] = None
+        self.preview_photo: Optional[tk.PhotoImage] = None
+
+        # Simplification runs in a separate process so PyVista/NumPy work
+        # never competes with the Tk event loop for the GIL. One worker is
+        # kept alive across runs to amortise interpreter and VTK start-up,
+        # and so it keeps its cached preview plotter. It must stay at one
+        # worker: _render_task reads the mesh _simplify_task left in its
+        # process, so both have to land in the same one.
+        self._process_pool = ProcessPoolExecutor(max_workers=1)
+        # Ties each run's full-size render to its own simplified mesh.
+        self._run_ids = itertools.count()
+        # Set on quit: a task already running in the worker still finishes
+        # and its done-callback must not touch the destroyed window.
+        self._closing = False
+        self.protocol("WM_DELETE_WINDOW", self.on_quit_clicked)
 
         self._build_ui()
 
@@ -265,6 +624,43 @@ class MeshSimplifierApp(BaseTk):
         )
         preserve_check.pack(side=tk.LEFT)
 
+        volume_check = ttk.Checkbutton(
+            options_frame,
+            text="Preserve volume",
+            variable=self.volume_preservation_var,
+        )
+        volume_check.pack(side=tk.LEFT, padx=10)
+
+        attribute_check = ttk.Checkbutton(
+            options_frame,
+            text="Use attribute error",
+            variable=self.attribute_error_var,
+        )
+        attribute_check.pack(side=tk.LEFT)
+
+        fast_check = ttk.Checkbutton(
+            options_frame,
+            text="Fast mode (cluster very large meshes first)",
+            variable=self.fast_mode_var,
+        )
+        fast_check.pack(side=tk.LEFT, padx=10)
+
+        # Output format row
+        output_frame = ttk.Frame(controls_frame)
+        output_frame.pack(fill=tk.X, pady=5)
+
+        output_label = ttk.Label(output_frame, text="Output format (OBJ/STL input):")
+        output_label.pack(side=tk.LEFT)
+
+        output_combo = ttk.Combobox(
+            output_frame,
+            textvariable=self.output_format_var,
+            values=(OUTPUT_FORMAT_PLY, OUTPUT_FORMAT_SAME),
+            state="readonly",
+            width=16,
+        )
+        output_combo.pack(side=tk.LEFT, padx=5)
+
         # Action buttons
         buttons_frame = ttk.Frame(controls_frame)
         buttons_frame.pack(fill=tk.X, pady=5)
@@ -276,7 +672,7 @@ class MeshSimplifierApp(BaseTk):
         )
         simplify_button.pack(side=tk.LEFT, padx=5)
 
-        quit_button = ttk.Button(buttons_frame, text="Quit", command=self.destroy)
+        quit_button = ttk.Button(buttons_frame, text="Quit", command=self.on_quit_clicked)
         quit_button.pack(side=tk.LEFT, padx=5)
 
         # Status label
@@ -327,6 +723,27 @@ class MeshSimplifierApp(BaseTk):
 
         self.preview_canvas = canvas
 
+    def on_quit_clicked(self) -> None:
+        """
+        Stop the worker process and close the window.
+        """
+        self._closing = True
+        self._process_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _post_to_ui(self, callback, *args) -> None:
+        """
+        Schedule callback(*args) on the Tk main loop from a future's
+        done-callback (an executor thread). Dropped once the app is closing.
+        """
+        if self._closing:
+            return
+        try:
+            self.after(0, callback, *args)
+        except (tk.TclError, RuntimeError):
+            # The window was destroyed between the check and the call.
+            pass
+
     def on_browse_clicked(self) -> None:
         """
         Browse for an input mesh file.
@@ -349,25 +766,18 @@ class MeshSimplifierApp(BaseTk):
         """
         Handle a file dropped onto the input entry (requires tkinterdnd2).
         """
-        data = str(event.data)
-        # On Windows, paths with spaces may be enclosed in { } braces.
-        if data.startswith("{") and data.endswith("}"):
-            data = data[1:-1]
-
-        # If multiple files were dropped, take the first one.
-        if " " in data and not data.startswith('"'):
-            first = data.split(" ")[0]
-        else:
-            first = data
-
-        path = first.strip()
+        # TkDnD sends a Tcl list: paths containing spaces are wrapped in
+        # { } braces, e.g. "{C:/my file.obj} C:/other.obj". If multiple files
+        # were dropped, take the first one.
+        matches = _DND_RE.findall(str(event.data))
+        path = next((braced or bare for braced, bare in matches), "").strip()
         if path:
             self.input_path_var.set(path)
             self.status_var.set(f"Dropped file: {path}")
 
     def on_simplify_clicked(self) -> None:
         """
-        Validate input and start simplification in a background thread.
+        Validate input and start simplification in the worker process.
         """
         input_str = self.input_path_var.get().strip()
         if not input_str:
@@ -387,57 +797,102 @@ class MeshSimplifierApp(BaseTk):
             )
             return
 
+        # Text formats are slow to write; by default OBJ/STL input is saved
+        # as binary PLY instead.
+        output_suffix = input_path.suffix
+        if (
+            self.output_format_var.get() == OUTPUT_FORMAT_PLY
+            and input_path.suffix.lower() in {".obj", ".stl"}
+        ):
+            output_suffix = ".ply"
         output_path = input_path.with_name(
-            f"{input_path.stem}_lowpoly{input_path.suffix}"
+            f"{input_path.stem}_lowpoly{output_suffix}"
         )
 
         preserve_topology = bool(self.preserve_topology_var.get())
+        volume_preservation = bool(self.volume_preservation_var.get())
+        attribute_error = bool(self.attribute_error_var.get())
+        fast_mode = bool(self.fast_mode_var.get())
+
+        # Render the preview at the size it will be shown at; winfo_* must be
+        # read here on the main thread.
+        window_size = self._preview_size()
 
         self.status_var.set(
             f"Simplifying '{input_path.name}' (reduction={reduction:.2f}, "
             f"preserve_topology={preserve_topology})..."
         )
 
-        # Run heavy work in a background thread to avoid freezing the UI
-        thread = threading.Thread(
-            target=self._simplify_worker,
-            args=(input_path, output_path, reduction, preserve_topology),
-            daemon=True,
+        # Run heavy work in the worker process to avoid freezing the UI
+        run_id = next(self._run_ids)
+        future = self._process_pool.submit(
+            _simplify_task,
+            run_id,
+            input_path,
+            output_path,
+            reduction,
+            preserve_topology,
+            volume_preservation,
+            attribute_error,
+            fast_mode,
+            window_size,
+        )
+        future.add_done_callback(
+            lambda f: self._post_to_ui(
+                self._on_simplify_done, run_id, input_path, window_size, f
+            )
         )
-        thread.start()
 
-    def _simplify_worker(
+    def _on_simplify_done(
         self,
+        run_id: int,
         input_path: Path,
-        output_path: Path,
-        reduction: float,
-        preserve_topology: bool,
+        window_size: Tuple[int, int],
+        future: Future,
     ) -> None:
         """
-        Worker thread: perform simplification and render preview.
+        Called on the main thread when the worker has simplified the mesh.
+
+        Shows the low-resolution preview straight away and asks the worker
+        for the full-size render.
         """
-        try:
-            original, simplified = simplify_mesh(
-                input_path=input_path,
-                output_path=output_path,
-                reduction=reduction,
-                preserve_topology=preserve_topology,
-            )
+        exc = future.exception()
+        if exc is not None:
+            print(f"[MeshSimplifierApp] Error during simplification: {exc}")
+            self._on_simplify_error(exc)
+            return
 
-            preview_img = render_preview_image(simplified, window_size=(800, 800))
+        output_path, png_bytes = future.result()
+        low_res_img = Image.open(io.BytesIO(png_bytes))
+        self.update_preview(low_res_img.resize(window_size, Image.BILINEAR))
+        self.status_var.set(
+            f"Simplified '{input_path.name}'; rendering full-size preview..."
+        )
 
-            # Schedule UI update back on the main thread
-            self.after(
-                0,
-                self._on_simplify_complete,
-                input_path,
-                output_path,
-                preview_img,
+        render_future = self._process_pool.submit(_render_task, run_id, window_size)
+        render_future.add_done_callback(
+            lambda f: self._post_to_ui(
+                self._on_render_done, input_path, output_path, f
             )
+        )
 
-        except Exception as exc:
+    def _on_render_done(
+        self,
+        input_path: Path,
+        output_path: Path,
+        future: Future,
+    ) -> None:
+        """
+        Called on the main thread when the full-size preview is ready.
+        """
+        exc = future.exception()
+        if exc is not None:
             print(f"[MeshSimplifierApp] Error during simplification: {exc}")
-            self.after(0, self._on_simplify_error, exc)
+            self._on_simplify_error(exc)
+            return
+
+        preview_img = Image.open(io.BytesIO(future.result()))
+        self._on_simplify_complete(input_path, output_path, preview_img)
 
     def _on_simplify_complete(
         self,
@@ -464,28 +919,47 @@ class MeshSimplifierApp(BaseTk):
         )
         self.status_var.set("Error occurred. See console for details.")
 
-    def update_preview(self, image: Image.Image) -> None:
+    def _preview_size(self) -> Tuple[int, int]:
         """
-        Resize and display the preview image in the GUI.
+        Size (width, height) available for the preview image on the canvas.
         """
-        self.preview_image = image
-
-        # Determine canvas size to scale image appropriately
         canvas_width = self.preview_canvas.winfo_width()
         canvas_height = self.preview_canvas.winfo_height()
 
         if canvas_width <= 1 or canvas_height <= 1:
             canvas_width, canvas_height = (600, 400)
 
-        img_w, img_h = self.preview_image.size
+        # Leave room for the preview label's padding
+        return max(1, canvas_width - 20), max(1, canvas_height - 20)
 
-        # Scale image to fit within canvas while preserving aspect ratio
-        scale = min(canvas_width / img_w, canvas_height / img_h, 1.0)
-        new_w = max(1, int(img_w * scale))
-        new_h = max(1, int(img_h * scale))
+    def update_preview(self, image: Image.Image) -> None:
+        """
+        Resize (if needed) and display the preview image in the GUI.
+        """
+        self.preview_image = image
 
-        resized = self.preview_image.resize((new_w, new_h), Image.LANCZOS)
-        self.preview_photo = ImageTk.PhotoImage(resized)
+        # Determine canvas size to scale image appropriately
+        canvas_width, canvas_height = self._preview_size()
+        img_w, img_h = self.preview_image.size
+
+        if img_w <= canvas_width and img_h <= canvas_height:
+            # Already rendered at (or below) the canvas size
+            resized = self.preview_image
+        else:
+            # Scale image to fit within canvas while preserving aspect ratio.
+            # Only a small fit-adjustment is expected here, so BILINEAR is
+            # indistinguishable from LANCZOS and much cheaper.
+            scale = min(canvas_width / img_w, canvas_height / img_h)
+            new_w = max(1, int(img_w * scale))
+            new_h = max(1, int(img_h * scale))
+            resized = self.preview_image.resize((new_w, new_h), Image.BILINEAR)
+
+        # Hand Tk a binary PPM directly; its native loader copies the pixels
+        # once, instead of going through PIL's ImageTk bridge.
+        if resized.mode != "RGB":
+            resized = resized.convert("RGB")
+        ppm = b"P6\n%d %d\n255\n" % resized.size + resized.tobytes()
+        self.preview_photo = tk.PhotoImage(data=ppm, format="PPM")
 
         self.preview_label.configure(image=self.preview_photo, text="")
         self.preview_label.image = self.preview_photo  # prevent GC
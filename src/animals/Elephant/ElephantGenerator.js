@@ -841,8 +841,10 @@ export class ElephantGenerator {
     // BufferGeometryUtils requires that all geometries share the same
     // attributes and index state. The procedural body parts above were
     // authored independently, so we normalise them here by ensuring each
-    // has position/normal/uv/skinIndex/skinWeight attributes and by
-    // converting everything to non-indexed form.
+    // has position/normal/uv/skinIndex/skinWeight attributes and by giving
+    // the few non-indexed parts (head dome, blend bridges) a trivial index.
+    // Every part carries its own normals and low-poly faceting comes from
+    // material.flatShading, so nothing needs the tripled non-indexed layout.
     const prepareForMerge = (geometry) => {
       let geo = geometry;
 
@@ -880,7 +882,11 @@ export class ElephantGenerator {
         return new THREE.Float32BufferAttribute(weights, 4);
       });
 
-      geo = geo.index ? geo.toNonIndexed() : geo;
+      if (!geo.index) {
+        const index = count > 65535 ? new Uint32Array(count) : new Uint16Array(count);
+        for (let i = 0; i < count; i += 1) index[i] = i;
+        geo.setIndex(new THREE.BufferAttribute(index, 1));
+      }
       geo.morphAttributes = geo.morphAttributes || {};
 
       return geo;
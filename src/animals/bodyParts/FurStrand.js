@@ -1,32 +1,79 @@
 
 // src/animals/bodyParts/FurStrand.js
-import * as THREE from 'three';
 
-export class FurStrand {
-  constructor(rootPos, rootNormal, length) {
-    this.root = rootPos.clone();
-    this.normal = rootNormal.clone().normalize();
-    this.length = length;
-    this.tip = this.root.clone().addScaledVector(this.normal, length);
-    this.velocity = new THREE.Vector3(0, 0, 0);
+// Strand state for a whole fur mesh, stored as flat xyz arrays (one slot per
+// strand) so per-frame updates allocate nothing. restRoot holds the bind-pose
+// roots; root is where each strand was last skinned to.
+export class FurStrands {
+  constructor(count) {
+    this.count = count;
+    this.restRoot = new Float32Array(count * 3);
+    this.root = new Float32Array(count * 3);
+    this.normal = new Float32Array(count * 3);
+    this.tip = new Float32Array(count * 3);
+    this.velocity = new Float32Array(count * 3);
+    this.lengths = new Float32Array(count);
   }
-  update(newRoot, newNormal, dt, params = {}) {
-    const gravity = params.gravity || new THREE.Vector3(0, -2.5, 0);
-    const stiffness = params.stiffness ?? 36;
-    const damping = params.damping ?? 8;
-    let dir = this.tip.clone().sub(newRoot).normalize();
-    let target = newRoot.clone().addScaledVector(newNormal, this.length);
-    let spring = target.clone().sub(this.tip).multiplyScalar(stiffness);
-    let damp = this.velocity.clone().multiplyScalar(-damping);
-    let force = spring.add(damp).add(gravity);
-    this.velocity.add(force.multiplyScalar(dt));
-    this.tip.add(this.velocity.clone().multiplyScalar(dt));
-    let curLen = this.tip.distanceTo(newRoot);
-    if (curLen > 0) {
-      let toTip = this.tip.clone().sub(newRoot).normalize();
-      this.tip.copy(newRoot).addScaledVector(toTip, this.length);
+
+  set(i, rx, ry, rz, nx, ny, nz, length) {
+    const k = i * 3;
+    const invLen = 1 / (Math.sqrt(nx * nx + ny * ny + nz * nz) || 1);
+    nx *= invLen; ny *= invLen; nz *= invLen;
+    this.restRoot[k] = rx; this.restRoot[k + 1] = ry; this.restRoot[k + 2] = rz;
+    this.root[k] = rx; this.root[k + 1] = ry; this.root[k + 2] = rz;
+    this.normal[k] = nx; this.normal[k + 1] = ny; this.normal[k + 2] = nz;
+    this.tip[k] = rx + nx * length; this.tip[k + 1] = ry + ny * length; this.tip[k + 2] = rz + nz * length;
+    this.velocity[k] = 0; this.velocity[k + 1] = 0; this.velocity[k + 2] = 0;
+    this.lengths[i] = length;
+  }
+
+  // Permutes the strands so that slot i holds the strand previously at order[i]
+  reorder(order) {
+    for (const key of ['restRoot', 'root', 'normal', 'tip', 'velocity']) {
+      const src = this[key];
+      const dst = new Float32Array(src.length);
+      for (let i = 0; i < this.count; ++i) {
+        const s = order[i] * 3, d = i * 3;
+        dst[d] = src[s]; dst[d + 1] = src[s + 1]; dst[d + 2] = src[s + 2];
+      }
+      this[key] = dst;
+    }
+    const lengths = new Float32Array(this.count);
+    for (let i = 0; i < this.count; ++i) lengths[i] = this.lengths[order[i]];
+    this.lengths = lengths;
+  }
+
+  // Steps strands [start, end): each root is the rest root moved by the
+  // affine 4x4 `m` (column-major elements), its tip is sprung towards
+  // root + normal * length and then restored to that length with a
+  // Follow-The-Leader step. gx/gy/gz is the gravity acceleration.
+  update(start, end, m, dt, stiffness, damping, gx, gy, gz) {
+    const { restRoot, root, normal, tip, velocity: vel, lengths } = this;
+    const m0 = m[0], m1 = m[1], m2 = m[2];
+    const m4 = m[4], m5 = m[5], m6 = m[6];
+    const m8 = m[8], m9 = m[9], m10 = m[10];
+    const m12 = m[12], m13 = m[13], m14 = m[14];
+    for (let i = start, k = start * 3; i < end; ++i, k += 3) {
+      const x = restRoot[k], y = restRoot[k + 1], z = restRoot[k + 2];
+      const rx = m0 * x + m4 * y + m8 * z + m12;
+      const ry = m1 * x + m5 * y + m9 * z + m13;
+      const rz = m2 * x + m6 * y + m10 * z + m14;
+      const length = lengths[i];
+      let tx = tip[k], ty = tip[k + 1], tz = tip[k + 2];
+      let vx = vel[k], vy = vel[k + 1], vz = vel[k + 2];
+
+      vx += ((rx + normal[k] * length - tx) * stiffness - vx * damping + gx) * dt;
+      vy += ((ry + normal[k + 1] * length - ty) * stiffness - vy * damping + gy) * dt;
+      vz += ((rz + normal[k + 2] * length - tz) * stiffness - vz * damping + gz) * dt;
+      tx += vx * dt; ty += vy * dt; tz += vz * dt;
+
+      // Follow-The-Leader: pull the tip back along root->tip to the segment
+      // length. The tiny bias keeps a collapsed tip finite without a branch.
+      const dx = tx - rx, dy = ty - ry, dz = tz - rz;
+      const s = length / Math.sqrt(dx * dx + dy * dy + dz * dz + 1e-20);
+      tip[k] = rx + dx * s; tip[k + 1] = ry + dy * s; tip[k + 2] = rz + dz * s;
+      vel[k] = vx; vel[k + 1] = vy; vel[k + 2] = vz;
+      root[k] = rx; root[k + 1] = ry; root[k + 2] = rz;
     }
-    this.root.copy(newRoot);
-    this.normal.copy(newNormal);
   }
 }
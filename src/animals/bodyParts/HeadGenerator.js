@@ -29,7 +29,7 @@ export function generateHeadGeometry(skeleton, options = {}) {
 
   const baseRadius = options.radius || 0.13;
   const detail = options.detail !== undefined ? options.detail : 0; 
-  let geo = new THREE.IcosahedronGeometry(1.0, detail); 
+  const geo = new THREE.IcosahedronGeometry(1.0, detail); 
 
   geo.scale(1.2 * baseRadius, 1.0 * baseRadius, length / 2);
   const quat = new THREE.Quaternion().setFromUnitVectors(
@@ -38,8 +38,6 @@ export function generateHeadGeometry(skeleton, options = {}) {
   geo.applyQuaternion(quat);
   geo.translate(mid.x, mid.y, mid.z);
 
-  if (geo.index) geo = geo.toNonIndexed();
-
   const vcount = geo.attributes.position.count;
   const skinIndices = new Uint16Array(vcount * 4);
   const skinWeights = new Float32Array(vcount * 4);
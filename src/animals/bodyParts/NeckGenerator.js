@@ -263,7 +263,7 @@ export function generateNeckGeometry(skeleton, options = {}) {
     }
   }
 
-  let geometry = buildBufferGeometry({
+  return buildBufferGeometry({
     positions,
     normals,
     skinIndices,
@@ -271,7 +271,4 @@ export function generateNeckGeometry(skeleton, options = {}) {
     uvs,
     indices
   });
-
-  if (geometry.index) geometry = geometry.toNonIndexed();
-  return geometry;
 }
@@ -181,7 +181,7 @@ export function generateTailGeometry(skeleton, options = {}) {
   // ------------------------------------------------------------
   // 6) Build BufferGeometry
   // ------------------------------------------------------------
-  let geometry = buildBufferGeometry({
+  return buildBufferGeometry({
     positions,
     normals,
     skinIndices,
@@ -189,11 +189,5 @@ export function generateTailGeometry(skeleton, options = {}) {
     uvs,
     indices
   });
-
-  if (geometry.index) {
-    geometry = geometry.toNonIndexed();
-  }
-
-  return geometry;
 }
 
@@ -0,0 +1,108 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import * as THREE from 'three';
+import { mergeFlatParts, mirrorGeometryX } from '../assets/GeometryBuilder.js';
+
+function flatPart(positions, extra = {}) {
+  const geometry = new THREE.BufferGeometry();
+  geometry.setAttribute('position', new THREE.BufferAttribute(new Float32Array(positions), 3));
+  for (const [name, attribute] of Object.entries(extra)) geometry.setAttribute(name, attribute);
+  return geometry;
+}
+
+function faceNormal(positions, t) {
+  const [a, b, c] = [0, 1, 2].map((k) => new THREE.Vector3().fromArray(positions, (t * 3 + k) * 3));
+  return b.sub(a).cross(c.sub(a)).normalize();
+}
+
+test('mergeFlatParts concatenates every attribute in part order', () => {
+  const a = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0], {
+    skinIndex: new THREE.BufferAttribute(new Uint8Array(12).fill(1), 4)
+  });
+  const b = flatPart([0, 0, 1, 1, 0, 1, 0, 1, 1], {
+    skinIndex: new THREE.BufferAttribute(new Uint8Array(12).fill(2), 4)
+  });
+
+  const merged = mergeFlatParts([a, b]);
+  assert.deepEqual(
+    Array.from(merged.getAttribute('position').array),
+    [...a.getAttribute('position').array, ...b.getAttribute('position').array]
+  );
+  const skinIndex = merged.getAttribute('skinIndex');
+  assert.ok(skinIndex.array instanceof Uint8Array, 'keeps the attribute array type');
+  assert.deepEqual(Array.from(skinIndex.array), [...new Array(12).fill(1), ...new Array(12).fill(2)]);
+});
+
+test('mergeFlatParts rejects parts whose attributes do not line up', () => {
+  const withNormal = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0], {
+    normal: new THREE.BufferAttribute(new Float32Array(9), 3)
+  });
+  const withoutNormal = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0]);
+  assert.throws(() => mergeFlatParts([withNormal, withoutNormal]), /missing the "normal" attribute/);
+  assert.throws(() => mergeFlatParts([withoutNormal, withNormal]), /"normal" attribute is not on every part/);
+
+  const wideIndex = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0], {
+    skinIndex: new THREE.BufferAttribute(new Uint16Array(12), 4)
+  });
+  const byteIndex = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0], {
+    skinIndex: new THREE.BufferAttribute(new Uint8Array(12), 4)
+  });
+  assert.throws(() => mergeFlatParts([wideIndex, byteIndex]), /"skinIndex" attribute layout differs/);
+});
+
+test('mergeFlatParts rejects indexed parts and an empty list', () => {
+  const soup = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0]);
+  const indexed = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0]);
+  indexed.setIndex([0, 1, 2]);
+  assert.throws(() => mergeFlatParts([soup, indexed]), /must be non-indexed/);
+  assert.throws(() => mergeFlatParts([indexed]), /must be non-indexed/);
+  assert.throws(() => mergeFlatParts([]), /no parts to merge/);
+});
+
+test('mirrorGeometryX reflects across x = 0 and keeps faces front-facing', () => {
+  // One triangle, counter-clockwise about its normal, tilted so the normal
+  // has an x component to flip.
+  const positions = [0.2, 0, 0, 1, 0.1, 0.3, 0.4, 1, 0.5];
+  const normal = faceNormal(positions, 0);
+  const geometry = flatPart(positions, {
+    normal: new THREE.BufferAttribute(new Float32Array([...normal.toArray(), ...normal.toArray(), ...normal.toArray()]), 3)
+  });
+
+  const mirrored = mirrorGeometryX(geometry);
+  const mirroredPositions = mirrored.getAttribute('position').array;
+  const mirroredNormal = new THREE.Vector3().fromArray(mirrored.getAttribute('normal').array);
+
+  assert.deepEqual(
+    Array.from(mirroredPositions),
+    Array.from(new Float32Array([-0.2, 0, 0, -0.4, 1, 0.5, -1, 0.1, 0.3])),
+    'x is negated and the last two corners are swapped'
+  );
+  assert.ok(mirroredNormal.distanceTo(new THREE.Vector3(-normal.x, normal.y, normal.z)) < 1e-6);
+  assert.ok(
+    faceNormal(mirroredPositions, 0).dot(mirroredNormal) > 0.999,
+    'winding agrees with the mirrored normal'
+  );
+  assert.deepEqual(
+    Array.from(geometry.getAttribute('position').array),
+    Array.from(new Float32Array(positions)),
+    'input geometry is untouched'
+  );
+});
+
+test('mirrorGeometryX remaps skin indices and moves weights with their corners', () => {
+  const geometry = flatPart([0, 0, 0, 1, 0, 0, 0, 1, 0], {
+    skinIndex: new THREE.BufferAttribute(new Uint8Array([3, 0, 0, 0, 4, 7, 0, 0, 5, 0, 0, 0]), 4),
+    skinWeight: new THREE.BufferAttribute(new Float32Array([1, 0, 0, 0, 0.75, 0.25, 0, 0, 1, 0, 0, 0]), 4)
+  });
+
+  const mirrored = mirrorGeometryX(geometry, new Map([[3, 13], [4, 14]]));
+  assert.deepEqual(
+    Array.from(mirrored.getAttribute('skinIndex').array),
+    [13, 0, 0, 0, 5, 0, 0, 0, 14, 7, 0, 0],
+    'left bones map to right ones, unmapped bones are kept'
+  );
+  assert.deepEqual(
+    Array.from(mirrored.getAttribute('skinWeight').array),
+    [1, 0, 0, 0, 1, 0, 0, 0, 0.75, 0.25, 0, 0]
+  );
+});